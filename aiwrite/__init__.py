@@ -9,7 +9,15 @@ from .models import Paper, Section, PaperStatus, PipelineStep, PipelineContext,
 from .llm import LLMProvider, LLMPurpose, LLMResponse, create_provider
 from .config import load_config, load_outline, save_outline, AppConfig
 from .pipeline import OutlineSuggestStep, SectionDraftStep, SectionRefineStep, PipelineExecutor
-from .render import LatexRenderer, WordExporter
+
+
+def __getattr__(name: str):
+    # 渲染模块依赖 python-docx / jinja2，导入较慢，首次访问时再导入
+    if name in ("LatexRenderer", "WordExporter"):
+        from . import render
+        return getattr(render, name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
 
 __all__ = [
     # 版本
@@ -30,7 +30,6 @@ from .config import (
 from .models import Paper, PaperStatus, LLMOptions
 from .pipeline import OutlineSuggestStep, SectionDraftStep, SectionRefineStep, AbstractGenerateStep, ImageAnalyzeStep, PipelineExecutor
 from .pipeline.init_step import OutlineInitializer, run_init_interactive
-from .render import LatexRenderer, WordExporter
 
 
 app = typer.Typer(
@@ -373,6 +372,9 @@ def finalize(
     # 保存处理后的结果
     save_outline(paper, input_file)
 
+    # 渲染模块依赖 python-docx / jinja2，只在导出时导入
+    from .render import LatexRenderer, WordExporter
+
     # 生成 LaTeX
     console.print("\n[bold blue]📄 生成 LaTeX 文档...[/bold blue]")
     latex_renderer = LatexRenderer()
@@ -15,6 +15,12 @@ from pydantic import BaseModel, Field
 from ..llm import LLMPurpose, create_provider, LLMProvider, create_vision_provider, VisionProvider
 from ..models import Paper, Section, PaperStatus, Figure, Table, FigureType
 
+# 优先使用 libyaml 的 C 解析器，大纲文件解析快一个数量级
+try:
+    from yaml import CSafeLoader as _YamlLoader
+except ImportError:  # PyYAML 未编译 libyaml 扩展
+    from yaml import SafeLoader as _YamlLoader
+
 
 class LLMConfig(BaseModel):
     """LLM 配置"""
@@ -152,7 +158,7 @@ def load_outline(file_path: str | Path) -> Paper:
         Paper 实例
     """
     with open(file_path, "r", encoding="utf-8") as f:
-        data = yaml.safe_load(f)
+        data = yaml.load(f, Loader=_YamlLoader)
 
     paper_data = data.get("paper", {})
     sections_data = data.get("sections", [])
@@ -133,18 +133,20 @@ class MermaidRenderer:
         self.use_offline = use_offline
         self._browser = None
         self._playwright = None
+        self._browser_lock = asyncio.Lock()
     
     async def _ensure_browser(self):
-        """确保浏览器已启动"""
-        if self._browser is None:
-            try:
-                from playwright.async_api import async_playwright
-                self._playwright = await async_playwright().start()
-                self._browser = await self._playwright.chromium.launch()
-            except ImportError:
-                raise ImportError(
-                    "需要安装 playwright: pip install playwright && playwright install chromium"
-                )
+        """确保浏览器已启动（并发渲染时只启动一次）"""
+        async with self._browser_lock:
+            if self._browser is None:
+                try:
+                    from playwright.async_api import async_playwright
+                    self._playwright = await async_playwright().start()
+                    self._browser = await self._playwright.chromium.launch()
+                except ImportError:
+                    raise ImportError(
+                        "需要安装 playwright: pip install playwright && playwright install chromium"
+                    )
     
     async def _close_browser(self):
         """关闭浏览器"""
@@ -186,6 +188,7 @@ class MermaidRenderer:
             f.write(html_content)
             temp_html_path = f.name
         
+        page = None
         try:
             # 创建页面并渲染
             page = await self._browser.new_page()
@@ -205,11 +208,12 @@ class MermaidRenderer:
             else:
                 await page.screenshot(path=str(output_path))
             
-            await page.close()
-            
             return output_path
             
         finally:
+            # 渲染失败或超时也要关闭页面，避免并发渲染时页面越积越多
+            if page is not None:
+                await page.close()
             # 清理临时文件
             Path(temp_html_path).unlink(missing_ok=True)
     
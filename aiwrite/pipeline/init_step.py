@@ -57,10 +57,13 @@ class OutlineInitializer:
         self.vision_provider = vision_provider or thinking_provider
         self.images_path = Path(images_path) if images_path else None
     
-    async def scan_images(self) -> list[dict]:
+    async def scan_images(self, concurrency: int = 8) -> list[dict]:
         """
         扫描图片目录并识别图片内容
         
+        Args:
+            concurrency: 批量识别失败后逐张识别时，同时发出的请求数上限
+        
         Returns:
             图片信息列表，包含路径和 AI 识别的描述
         """
@@ -93,14 +96,22 @@ class OutlineInitializer:
                 console.print(f"  ✓ {img['filename']} → [green]{desc[:40]}...[/green]" if len(desc) > 40 else f"  ✓ {img['filename']} → [green]{desc}[/green]")
         except Exception as e:
             console.print(f"[yellow]批量识别失败，改用逐张识别: {e}[/yellow]")
-            # 回退到逐张识别
-            for i, img in enumerate(images, 1):
+            # 回退到逐张识别：各张图片互不依赖，限制并发数后同时请求
+            semaphore = asyncio.Semaphore(concurrency)
+            done = 0
+            
+            async def analyze_one(img: dict):
+                nonlocal done
                 try:
-                    description = await self._analyze_image(img["full_path"])
+                    async with semaphore:
+                        description = await self._analyze_image(img["full_path"])
                     img["description"] = description
-                    console.print(f"  [{i}/{len(images)}] {img['filename']} → [green]{description[:40]}[/green]")
+                    done += 1
+                    console.print(f"  [{done}/{len(images)}] {img['filename']} → [green]{description[:40]}[/green]")
                 except Exception:
                     img["description"] = f"图片: {img['filename']}"
+            
+            await asyncio.gather(*(analyze_one(img) for img in images))
         
         # 清理临时字段
         for img in images:
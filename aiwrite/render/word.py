@@ -6,22 +6,347 @@ Word 导出器
 
 from __future__ import annotations
 
+import copy
+import gc
+import os
 import subprocess
 import shutil
+import struct
 import re
+from collections import deque
+from contextlib import contextmanager
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import Literal, TYPE_CHECKING
+from typing import Literal
+from xml.sax.saxutils import escape as xml_escape
 
 from rich.console import Console
 
 from ..models import Paper, Section, Figure, Table
 from .latex import LatexRenderer
 
-if TYPE_CHECKING:
+try:
     from docx import Document
+    from docx.enum.style import WD_STYLE_TYPE
+    from docx.enum.table import WD_TABLE_ALIGNMENT
+    from docx.enum.text import WD_ALIGN_PARAGRAPH, WD_BREAK
+    from docx.image.exceptions import (
+        InvalidImageStreamError,
+        UnexpectedEndOfFileError,
+        UnrecognizedImageError,
+    )
+    from docx.image.image import Image as DocxImage
+    from docx.opc.constants import RELATIONSHIP_TYPE as RT
+    from docx.oxml import parse_xml
+    from docx.oxml.ns import qn
+    from docx.oxml.shape import CT_Inline
+    from docx.oxml.table import CT_Tbl
+    from docx.shared import Cm, Inches, Pt
+    from docx.table import Table as DocxTable
+except ImportError:
+    # 未安装 python-docx 时仍可使用 pandoc 导出，_export_via_docx 会给出安装提示
+    Document = None
 
 console = Console()
 
+# LaTeX 转义符号 → 普通字符
+_LATEX_ESCAPES = (
+    ("\\%", "%"),
+    ("\\$", "$"),
+    ("\\&", "&"),
+    ("\\#", "#"),
+    ("\\_", "_"),
+    ("\\{", "{"),
+    ("\\}", "}"),
+)
+
+# LaTeX 正文清理用的预编译正则（按 _tokenize_latex_content 中的顺序应用）
+_RE_MATH = re.compile(r"\$([^$]+)\$")
+_RE_FIGURE_PLACEHOLDER = re.compile(r"\{\{FIGURE:([^:]*):([^}]*)\}\}")
+_RE_TABLE_PLACEHOLDER = re.compile(r"\{\{TABLE:([^:]*):([^}]*)\}\}")
+_RE_TEXTBF = re.compile(r"\\textbf\{([^}]*)\}")
+_RE_TEXTIT = re.compile(r"\\textit\{([^}]*)\}")
+_RE_EMPH = re.compile(r"\\emph\{([^}]*)\}")
+_RE_CITE = re.compile(r"\\cite\{[^}]*\}")
+_RE_REFS = (
+    re.compile(r"\\label\{[^}]*\}"),
+    re.compile(r"\\ref\{[^}]*\}"),
+    re.compile(r"\\pageref\{[^}]*\}"),
+    re.compile(r"\\autoref\{[^}]*\}"),
+)
+_RE_SECTION = re.compile(r"\\section\{([^}]*)\}")
+_RE_SUBSECTION = re.compile(r"\\subsection\{([^}]*)\}")
+_RE_SUBSUBSECTION = re.compile(r"\\subsubsection\{([^}]*)\}")
+_RE_MD_H3 = re.compile(r"^### (.+)$", re.MULTILINE)
+_RE_MD_H2 = re.compile(r"^## (.+)$", re.MULTILINE)
+_RE_MD_H1 = re.compile(r"^# .+$", re.MULTILINE)
+_RE_COMMAND_SPECIAL = re.compile(r"[\\{}]")
+_RE_COMMAND_NAME = re.compile(r"\\[a-zA-Z]+\*?")
+# _strip_latex_commands 用的合并正则：一次扫描中按分支顺序识别
+# \(sub)*section{...}、\textbf/\textit/\emph{...}、\cite{...}、其他带参数命令、不带参数命令
+_RE_LATEX_STRIP = re.compile(
+    r"\\(?:sub)*section\{[^}]*\}"
+    r"|\\(?:textbf|textit|emph)\{([^}]*)\}"
+    r"|(\\cite\{[^}]*\})"
+    r"|\\[a-zA-Z]+\{[^}]*\}"
+    r"|\\[a-zA-Z]+"
+)
+_RE_LABEL_TEXT = re.compile(r"\b(sec|subsec|fig|tab|eq|chap):[a-zA-Z0-9_-]+\b")
+_RE_BLANK_LINES = re.compile(r"\n{3,}")
+# 由空行分隔的段落（逐个匹配，不生成完整的段落列表）
+_RE_PARAGRAPH = re.compile(r"[^\n]+(?:\n(?!\n)[^\n]+)*")
+_RE_HEADING_MARK = re.compile(r"<<HEADING:(\d+):(.+)>>")
+_RE_FIGURE_MARK = re.compile(r"<<FIGURE:([^:]*):([^>]*)>>")
+_RE_TABLE_MARK = re.compile(r"<<TABLE:([^:]*):([^>]*)>>")
+_RE_LINE_BREAK = re.compile(r"\s*\n\s*")
+_RE_WHITESPACE = re.compile(r"\s+")
+
+# 目录域（TOC）XML 模板，需要用户在 Word 中手动更新域
+_TOC_FIELD_XML = (
+    '<w:r xmlns:w="http://schemas.openxmlformats.org/wordprocessingml/2006/main">'
+    '<w:fldChar w:fldCharType="begin"/>'
+    '<w:instrText xml:space="preserve">TOC \\o "1-3" \\h \\z \\u</w:instrText>'
+    '<w:fldChar w:fldCharType="separate"/>'
+    '<w:fldChar w:fldCharType="end"/>'
+    '</w:r>'
+)
+
+# 表格单元格 run 的格式模板（宋体 10 磅，表头加粗），导入时解析一次、每个 run 深拷贝
+_CELL_RPR_XML = (
+    '<w:rPr xmlns:w="http://schemas.openxmlformats.org/wordprocessingml/2006/main">'
+    '<w:rFonts w:ascii="宋体" w:hAnsi="宋体"/>{bold}<w:sz w:val="20"/>'
+    '</w:rPr>'
+)
+if Document is not None:
+    _CELL_RPR = parse_xml(_CELL_RPR_XML.format(bold=""))
+    _HEADER_CELL_RPR = parse_xml(_CELL_RPR_XML.format(bold="<w:b/>"))
+    # 插入图片的统一宽度
+    _FIGURE_WIDTH = Inches(5)
+
+# 图表标题段落样式名（在 _set_document_defaults 中创建）
+_CAPTION_STYLE_NAME = "图表标题"
+
+# 图表占位符段落 XML 模板（居中、无首行缩进、宋体斜体），{size} 为半磅字号
+_PLACEHOLDER_XML = (
+    '<w:p xmlns:w="http://schemas.openxmlformats.org/wordprocessingml/2006/main">'
+    '<w:pPr><w:ind w:firstLine="0"/><w:jc w:val="center"/></w:pPr>'
+    '<w:r><w:rPr>'
+    '<w:rFonts w:ascii="宋体" w:hAnsi="宋体"/>'
+    '<w:i/><w:sz w:val="{size}"/>'
+    '</w:rPr>{content}</w:r>'
+    '</w:p>'
+)
+
+# 连续正文段落批量解析用的容器（格式全部继承 Normal 样式，段落本身不带属性）
+_BODY_PARAGRAPHS_XML = (
+    '<w:body xmlns:w="http://schemas.openxmlformats.org/wordprocessingml/2006/main">'
+    '{paragraphs}'
+    '</w:body>'
+)
+
+_RE_RUN_SPECIAL = re.compile(r"([\t\r\n])")
+
+
+def _run_content_xml(text: str) -> str:
+    """把文本转换为 w:r 内容 XML，与 python-docx 的 add_run 规则一致（制表符、换行、首尾空白）"""
+    pieces: list[str] = []
+    for piece in _RE_RUN_SPECIAL.split(text):
+        if piece == "\t":
+            pieces.append("<w:tab/>")
+        elif piece in ("\r", "\n"):
+            pieces.append("<w:br/>")
+        elif piece:
+            if piece.strip() != piece:
+                pieces.append(f'<w:t xml:space="preserve">{xml_escape(piece)}</w:t>')
+            else:
+                pieces.append(f"<w:t>{xml_escape(piece)}</w:t>")
+    return "".join(pieces)
+
+
+def _strip_latex_match(match: re.Match[str]) -> str:
+    """_RE_LATEX_STRIP 的替换回调：按命中的分支返回替换文本"""
+    formatted, cite = match.group(1, 2)
+    if formatted is not None:
+        return formatted
+    if cite is not None:
+        return "[引用]"
+    return ""
+
+
+@contextmanager
+def _gc_paused():
+    """暂停循环垃圾回收：组装文档时会创建大量长期存活的对象，频繁的 GC 扫描只是白白耗时"""
+    was_enabled = gc.isenabled()
+    gc.disable()
+    try:
+        yield
+    finally:
+        if was_enabled:
+            gc.enable()
+
+
+def _take_matching(
+    caption: str,
+    by_caption: dict[str, Figure | Table],
+    pending: deque[Figure | Table],
+    inserted: set[int],
+) -> Figure | Table | None:
+    """
+    为占位符取出对应的图片/表格：优先按标题匹配，否则取第一个尚未插入的
+
+    inserted 按对象标识记录已插入的项（id 可能为空或重复）
+    """
+    item = by_caption.pop(caption, None)
+    if item is None or id(item) in inserted:
+        item = None
+        while pending:
+            candidate = pending.popleft()
+            if id(candidate) not in inserted:
+                item = candidate
+                break
+    if item is not None:
+        inserted.add(id(item))
+    return item
+
+
+def _strip_remaining_commands(content: str, keep_args: bool = True) -> str:
+    """
+    单次从左到右扫描，移除剩余的 LaTeX 命令
+
+    - \\cmd{arg} / \\cmd*{arg}：保留 arg（arg 内的命令和花括号同样移除）
+    - 没有参数的 \\cmd：直接移除
+    - 所有花括号：移除
+    """
+    parts: list[str] = []
+    length = len(content)
+    pos = 0
+    # 最近一次找到的 "}" 位置，避免在没有闭合括号的长文本上反复向后查找
+    close_pos = -1
+    while True:
+        special = _RE_COMMAND_SPECIAL.search(content, pos)
+        if special is None:
+            parts.append(content[pos:])
+            break
+        start = special.start()
+        parts.append(content[pos:start])
+        if content[start] != "\\":
+            # 花括号直接移除
+            pos = start + 1
+            continue
+        name_match = _RE_COMMAND_NAME.match(content, start)
+        if name_match is None:
+            # 反斜杠后不是命令名，原样保留
+            parts.append("\\")
+            pos = start + 1
+            continue
+        pos = name_match.end()
+        if keep_args and pos < length and content[pos] == "{":
+            if close_pos <= pos and close_pos != length:
+                close_pos = content.find("}", pos + 1)
+                if close_pos == -1:
+                    close_pos = length
+            if close_pos < length:
+                parts.append(_strip_remaining_commands(content[pos + 1:close_pos], keep_args=False))
+                pos = close_pos + 1
+    return "".join(parts)
+
+
+def _tokenize_latex_content(latex_content: str) -> tuple[list[tuple[str, object]], bool]:
+    """
+    将 LaTeX 正文转换为 (类型, 内容) 标记序列，供 Word 导出逐个写入文档
+
+    标记类型：
+    - ("heading", (相对级别, 标题))
+    - ("figure", (图片标题, 说明))
+    - ("table", (表格标题, 说明))
+    - ("text", 段落文本)
+
+    Returns:
+        (标记列表, 内容中是否包含 \\subsection)
+    """
+    # 先处理 LaTeX 转义符号
+    content = latex_content
+    for escaped, char in _LATEX_ESCAPES:
+        content = content.replace(escaped, char)
+    
+    # 处理数学公式 $...$
+    content = _RE_MATH.sub(r"\1", content)
+    
+    # 处理图表占位符 - 转换为特殊标记以便后续处理
+    content = _RE_FIGURE_PLACEHOLDER.sub(r"\n\n<<FIGURE:\1:\2>>\n\n", content)
+    content = _RE_TABLE_PLACEHOLDER.sub(r"\n\n<<TABLE:\1:\2>>\n\n", content)
+    
+    # 处理 \textbf{...} - 保留内容
+    content = _RE_TEXTBF.sub(r"\1", content)
+    
+    # 处理 \textit{...} 和 \emph{...}
+    content = _RE_TEXTIT.sub(r"\1", content)
+    content = _RE_EMPH.sub(r"\1", content)
+    
+    # 处理 \cite{...}
+    content = _RE_CITE.sub("[引用]", content)
+    
+    # 移除 \label{...} 和 \ref{...} 等引用命令（这些不应该出现在Word中）
+    for pattern in _RE_REFS:
+        content = pattern.sub("", content)
+    
+    # 使用特殊标记分割章节和内容
+    # 将 \section{...} \subsection{...} 等替换为特殊标记 (LaTeX格式)
+    content = _RE_SECTION.sub(r"\n\n<<HEADING:1:\1>>\n\n", content)
+    content, subsection_count = _RE_SUBSECTION.subn(r"\n\n<<HEADING:2:\1>>\n\n", content)
+    content = _RE_SUBSUBSECTION.sub(r"\n\n<<HEADING:3:\1>>\n\n", content)
+    
+    # 同时处理 Markdown 格式的标题
+    # ### 三级标题
+    content = _RE_MD_H3.sub(r"\n\n<<HEADING:3:\1>>\n\n", content)
+    # ## 二级标题
+    content = _RE_MD_H2.sub(r"\n\n<<HEADING:2:\1>>\n\n", content)
+    # # 一级标题 (章节主标题,通常已经在外面处理了,这里忽略)
+    content = _RE_MD_H1.sub(r"", content)
+    
+    # 移除其他 LaTeX 命令但保留内容
+    content = _strip_remaining_commands(content)
+    
+    # 移除残留的 sec: subsec: 等标签文本
+    content = _RE_LABEL_TEXT.sub("", content)
+    
+    # 清理多余空行
+    content = _RE_BLANK_LINES.sub("\n\n", content)
+    
+    # 按段落逐个匹配
+    tokens: list[tuple[str, object]] = []
+    for para_match in _RE_PARAGRAPH.finditer(content):
+        para_text = para_match.group(0).strip()
+        
+        # 跳过空段落
+        if not para_text or len(para_text) < 2:
+            continue
+        
+        # 检查是否是标题标记
+        heading_match = _RE_HEADING_MARK.match(para_text)
+        if heading_match:
+            tokens.append(("heading", (int(heading_match.group(1)), heading_match.group(2).strip())))
+            continue
+        
+        # 检查是否是图片标记
+        figure_match = _RE_FIGURE_MARK.match(para_text)
+        if figure_match:
+            tokens.append(("figure", (figure_match.group(1).strip(), figure_match.group(2).strip())))
+            continue
+        
+        # 检查是否是表格标记
+        table_match = _RE_TABLE_MARK.match(para_text)
+        if table_match:
+            tokens.append(("table", (table_match.group(1).strip(), table_match.group(2).strip())))
+            continue
+        
+        # 合并段落内的换行
+        para_text = _RE_LINE_BREAK.sub(" ", para_text)
+        para_text = _RE_WHITESPACE.sub(" ", para_text).strip()
+        tokens.append(("text", para_text))
+    
+    return tokens, subsection_count > 0
+
 
 class WordExporter:
     """
@@ -53,9 +378,40 @@ class WordExporter:
         self.pandoc_path = pandoc_path or self._find_pandoc()
         self.reference_doc = Path(reference_doc) if reference_doc else None
         self.images_base_path = Path(images_base_path) if images_base_path else None
+        # 字符串形式的基础路径，供 _resolve_image_path 走 os.path 快速路径
+        self._ib_str = str(self.images_base_path) if self.images_base_path else None
         self.latex_renderer = LatexRenderer()
+        # 文档末尾的哨兵段落：新块元素都插在它前面（O(1)），保存前移除
+        self._sentinel = None
+        # 版心宽度（页宽减左右边距），创建表格时使用，避免每次重新计算
+        self._block_width = None
+        # Heading 1..9 的样式 ID，由 _set_document_defaults 在每个文档上缓存
+        self._heading_style_ids: list[str] = []
+        self._caption_style_id: str | None = None
+        # 导出前并行读取并解析好的图片（已算出 SHA1）和 Excel 表格内容（按解析后的路径索引）
+        self._images: dict[Path, DocxImage] = {}
+        # 预读时校验失败（无法读取或格式不支持）的图片及原因
+        self._image_errors: dict[Path, str] = {}
+        self._table_rows: dict[Path, list[list[str]]] = {}
+        # 单次导出内的缓存：figure.path → 解析结果；图片路径 → (rId, 宽, 高)
+        self._resolved_paths: dict[str, Path] = {}
+        # figure.path → (解析后的路径, 文件是否存在)；路径无效时解析结果为 None
+        self._figure_images: dict[str, tuple[Path | None, bool]] = {}
+        self._picture_parts: dict[Path, tuple[str, int, int]] = {}
+        # 本文档中已有的图片部件（按内容 SHA1），相同内容的图片只嵌入一次
+        self._image_parts_by_sha1: dict[str, object] = {}
+        # 插入图片/表格时的提示信息，整篇文档组装完成后一次性输出
+        self._insert_log: list[str] = []
 
     def _resolve_image_path(self, figure_path: str) -> Path:
+        """解析图片/表格路径，同一次导出中重复引用的路径直接返回缓存结果"""
+        resolved = self._resolved_paths.get(figure_path)
+        if resolved is None:
+            resolved = self._locate_image_path(figure_path)
+            self._resolved_paths[figure_path] = resolved
+        return resolved
+
+    def _locate_image_path(self, figure_path: str) -> Path:
         """
         智能解析图片路径，避免路径重复拼接
         
@@ -64,34 +420,35 @@ class WordExporter:
         - figure_path = img/1.png
         - 结果应为 D:/project/img/1.png 而不是 D:/project/img/img/1.png
         """
-        figure_path_obj = Path(figure_path)
+        if not self._ib_str:
+            return Path(figure_path)
         
-        if not self.images_base_path:
-            return figure_path_obj
+        # 使用字符串路径 + os.path.exists，避免每个候选都构造 Path 对象
+        base = self._ib_str
         
         # 直接拼接的路径
-        direct_path = self.images_base_path / figure_path
+        direct_path = os.path.join(base, figure_path)
         
         # 如果直接拼接的路径存在，使用它
-        if direct_path.exists():
-            return direct_path
+        if os.path.exists(direct_path):
+            return Path(direct_path)
         
         # 检查是否有路径重复（如 base=.../img, path=img/1.png）
         # 尝试只使用文件名
-        filename_only = self.images_base_path / figure_path_obj.name
-        if filename_only.exists():
-            return filename_only
+        figure_path_obj = Path(figure_path)
+        filename_only = os.path.join(base, figure_path_obj.name)
+        if os.path.exists(filename_only):
+            return Path(filename_only)
         
         # 尝试去掉 figure_path 的第一层目录
         parts = figure_path_obj.parts
         if len(parts) > 1:
-            without_first = Path(*parts[1:])
-            alt_path = self.images_base_path / without_first
-            if alt_path.exists():
-                return alt_path
+            alt_path = os.path.join(base, *parts[1:])
+            if os.path.exists(alt_path):
+                return Path(alt_path)
         
         # 都不存在，返回直接拼接的路径（让后续代码处理不存在的情况）
-        return direct_path
+        return Path(direct_path)
 
     def _find_pandoc(self) -> str | None:
         """查找 pandoc 可执行文件"""
@@ -192,27 +549,35 @@ class WordExporter:
         use_final: bool,
     ) -> Path:
         """通过 python-docx 直接生成 Word"""
-        try:
-            from docx import Document
-            from docx.shared import Pt, Inches, Cm
-            from docx.enum.text import WD_ALIGN_PARAGRAPH
-            from docx.enum.style import WD_STYLE_TYPE
-            from docx.oxml.ns import qn
-            from docx.oxml import OxmlElement
-        except ImportError:
+        if Document is None:
             raise RuntimeError(
                 "python-docx 未安装。请运行: pip install python-docx"
             )
 
         console.print("[cyan]📄 正在直接生成 Word 文档...[/cyan]")
 
+        # 路径解析结果和图片关系 ID 只在本次导出内有效
+        self._resolved_paths = {}
+        self._figure_images = {}
+        self._picture_parts = {}
+        self._image_parts_by_sha1 = {}
+        self._insert_log = []
+
+        # 并行预读图片和表格文件，后续串行组装文档时直接使用内存数据
+        self._prefetch_resources(paper)
+
         doc = Document()
         
         # 设置文档默认字体和段落格式
         self._set_document_defaults(doc)
 
+        # python-docx 的 doc.add_paragraph 每次都要在 body 中线性查找 sectPr，
+        # 文档越长越慢；改为统一插在哨兵段落之前
+        self._block_width = doc._block_width
+        self._sentinel = doc.add_paragraph()
+
         # 论文标题
-        title_para = doc.add_paragraph()
+        title_para = self._add_paragraph(doc)
         title_run = title_para.add_run(paper.title)
         title_run.bold = True
         title_run.font.size = Pt(22)
@@ -224,16 +589,16 @@ class WordExporter:
 
         # 作者
         if paper.authors:
-            author_para = doc.add_paragraph()
+            author_para = self._add_paragraph(doc)
             author_run = author_para.add_run(", ".join(paper.authors))
             author_run.font.size = Pt(12)
             author_para.alignment = WD_ALIGN_PARAGRAPH.CENTER
             author_para.paragraph_format.first_line_indent = Cm(0)
 
-        doc.add_page_break()
+        self._add_page_break(doc)
 
         # 添加目录标题
-        toc_title = doc.add_paragraph()
+        toc_title = self._add_paragraph(doc)
         toc_run = toc_title.add_run("目  录")
         toc_run.bold = True
         toc_run.font.size = Pt(16)
@@ -246,28 +611,139 @@ class WordExporter:
         # 添加目录域（需要用户手动更新）
         self._add_toc_field(doc)
         
-        doc.add_paragraph()  # 空行
-        hint_para = doc.add_paragraph()
+        self._add_paragraph(doc)  # 空行
+        hint_para = self._add_paragraph(doc)
         hint_run = hint_para.add_run('（请右键点击目录，选择"更新域"以生成目录）')
         hint_run.italic = True
         hint_para.paragraph_format.first_line_indent = Cm(0)
 
         # 章节内容
-        for i, section in enumerate(paper.sections):
-            # 每个主要章节前添加分页符
-            doc.add_page_break()
-            self._add_section_to_doc(doc, section, use_final, level=1, is_first_section=(i==0), keywords=paper.keywords, keywords_en=paper.keywords_en)
-
-        # 保存文档
+        with _gc_paused():
+            for i, section in enumerate(paper.sections):
+                # 每个主要章节前添加分页符
+                self._add_page_break(doc)
+                self._add_section_to_doc(doc, section, use_final, level=1, is_first_section=(i==0), keywords=paper.keywords, keywords_en=paper.keywords_en)
+
+        # 图片已交给文档的图片部件，释放预读缓存后统一回收一次
+        self._images = {}
+        self._table_rows = {}
+        gc.collect()
+
+        # 逐图逐表的提示合并为一次输出
+        if self._insert_log:
+            console.print("\n".join(self._insert_log))
+            self._insert_log = []
+
+        # 移除哨兵段落后保存文档
+        sentinel = self._sentinel._p
+        sentinel.getparent().remove(sentinel)
+        self._sentinel = None
         doc.save(str(output_path))
+        self._picture_parts = {}
         console.print(f"[green]✓ Word 文档已生成: {output_path}[/green]")
 
         return output_path
 
+    def _prefetch_resources(self, paper: Paper, max_workers: int = 8) -> None:
+        """并行读取论文中所有图片字节和 Excel 表格内容"""
+        from ..utils.excel import read_excel_file
+
+        image_paths: set[Path] = set()
+        table_paths: set[Path] = set()
+        for section in paper.get_all_sections():
+            for figure in section.figures:
+                image_path, exists = self._figure_image(figure)
+                if exists:
+                    image_paths.add(image_path)
+            for table in section.tables:
+                if table.path:
+                    table_path = self._resolve_image_path(table.path)
+                    if table_path not in table_paths and table_path.is_file():
+                        table_paths.add(table_path)
+
+        self._images = {}
+        self._image_errors = {}
+        self._table_rows = {}
+        if not image_paths and not table_paths:
+            return
+
+        def read_image(path: Path) -> tuple[DocxImage | None, str | None]:
+            # 读取并解析图片头做一次校验，插入时不再需要逐张捕获异常；
+            # SHA1 也在线程里算好（hashlib 计算时释放 GIL）
+            # 只捕获读文件和解析图片头会抛出的异常（JPEG 缺少 SOF 等标记时
+            # python-docx 抛 KeyError，截断的 GIF 抛 struct.error），
+            # 其余异常属于程序错误，直接上抛
+            try:
+                image = DocxImage.from_blob(path.read_bytes())
+                image.sha1
+            except (
+                OSError,
+                KeyError,
+                struct.error,
+                InvalidImageStreamError,
+                UnexpectedEndOfFileError,
+                UnrecognizedImageError,
+            ) as e:
+                return None, str(e) or type(e).__name__
+            return image, None
+
+        def read_rows(path: Path) -> list[list[str]] | None:
+            # 读取失败时留给 _insert_table 重新读取并报告错误
+            try:
+                return read_excel_file(path)
+            except Exception:
+                return None
+
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            image_results = executor.map(read_image, image_paths)
+            table_results = executor.map(read_rows, table_paths)
+            for path, (image, error) in zip(image_paths, image_results):
+                if error is None:
+                    self._images[path] = image
+                else:
+                    self._image_errors[path] = error
+            self._table_rows = {
+                path: rows for path, rows in zip(table_paths, table_results) if rows is not None
+            }
+
+    def _figure_image(self, figure: Figure) -> tuple[Path | None, bool]:
+        """校验并解析图片路径，返回 (路径, 是否存在)；同一 figure.path 只检查一次文件系统"""
+        cached = self._figure_images.get(figure.path)
+        if cached is None:
+            if not figure.path or figure.path.strip() in ('', '.', '..'):
+                cached = (None, False)
+            else:
+                image_path = self._resolve_image_path(figure.path)
+                cached = (image_path, image_path.is_file())
+            self._figure_images[figure.path] = cached
+        return cached
+
+    def _add_picture(self, run, image_path: Path) -> None:
+        """插入图片，优先使用预读解析好的图片；同一图片再次插入时复用已有的图片部件和尺寸"""
+        part = run.part
+        picture = self._picture_parts.get(image_path)
+        if picture is None:
+            # 图片交给图片部件后不再需要，取出即从预读缓存中释放
+            image = self._images.pop(image_path, None)
+            if image is None:
+                image = DocxImage.from_file(str(image_path))
+            # python-docx 查找重复图片时会对已有的每个图片部件重新计算 SHA1，
+            # 这里按 SHA1 自己索引，避免图片越多越慢
+            image_part = self._image_parts_by_sha1.get(image.sha1)
+            if image_part is None:
+                image_part = part.package.image_parts._add_image_part(image)
+                self._image_parts_by_sha1[image.sha1] = image_part
+            rId = part.relate_to(image_part, RT.IMAGE)
+            picture = (rId, *image.scaled_dimensions(_FIGURE_WIDTH, None))
+            self._picture_parts[image_path] = picture
+        rId, cx, cy = picture
+
+        # 与 run.add_picture 相同的 inline 结构；图片名称统一用文件名（内存流没有文件名）
+        inline = CT_Inline.new_pic_inline(part.next_id, rId, image_path.name, cx, cy)
+        run._r.add_drawing(inline)
+
     def _set_document_defaults(self, doc: "Document") -> None:
         """设置文档默认样式"""
-        from docx.shared import Pt, Cm
-        from docx.oxml.ns import qn
 
         # 设置正文样式
         style = doc.styles['Normal']
@@ -293,32 +769,96 @@ class WordExporter:
             heading_style.paragraph_format.space_before = Pt(12)
             heading_style.paragraph_format.space_after = Pt(6)
 
+        # 缓存各级标题的样式 ID，添加标题时不再按名称遍历样式表；
+        # 4 级以下标题只补上东亚字体和不缩进，所有标题段落都从样式继承
+        self._heading_style_ids = []
+        for i in range(1, 10):
+            heading_style = doc.styles[f'Heading {i}']
+            rFonts = heading_style.element.get_or_add_rPr().get_or_add_rFonts()
+            rFonts.set(qn('w:eastAsia'), '黑体')
+            # 默认模板的标题样式带主题字体属性，其优先级高于具体字体名
+            #（主题中的中文标题字体是宋体），需要删掉
+            for attr in ('w:eastAsiaTheme', 'w:asciiTheme', 'w:hAnsiTheme'):
+                rFonts.attrib.pop(qn(attr), None)
+            if i > 3:
+                heading_style.paragraph_format.first_line_indent = Cm(0)
+            self._heading_style_ids.append(heading_style.style_id)
+
+        # 图表标题样式：基于正文，居中、不缩进、10 磅、段后 12 磅
+        caption_style = doc.styles.add_style(_CAPTION_STYLE_NAME, WD_STYLE_TYPE.PARAGRAPH)
+        caption_style.base_style = style
+        caption_style.font.size = Pt(10)
+        caption_style.paragraph_format.alignment = WD_ALIGN_PARAGRAPH.CENTER
+        caption_style.paragraph_format.first_line_indent = Cm(0)
+        caption_style.paragraph_format.space_after = Pt(12)
+        self._caption_style_id = caption_style.style_id
+
+    def _add_caption(self, doc: "Document", text: str) -> None:
+        """添加图表标题段落（格式由图表标题样式提供）"""
+        caption = self._add_paragraph(doc)
+        caption.add_run(text)
+        caption._p.style = self._caption_style_id
+
+    def _add_heading(self, doc: "Document", text: str, level: int):
+        """添加标题段落，直接写入缓存的样式 ID（不缩进由标题样式提供）"""
+        heading = self._add_paragraph(doc)
+        if text:
+            heading.add_run(text)
+        heading._p.style = self._heading_style_ids[level - 1]
+
+        # 设置标题字体
+        for run in heading.runs:
+            run.font.name = '黑体'
+
+        return heading
+
+    def _insert_block(self, doc: "Document", element) -> None:
+        """把块级元素（段落/表格）插到正文末尾：有哨兵时插在哨兵之前"""
+        if self._sentinel is not None:
+            self._sentinel._p.addprevious(element)
+        else:
+            doc.element.body.insert_element_before(element, "w:sectPr")
+
+    def _add_paragraph(self, doc: "Document"):
+        """在正文末尾添加空段落"""
+        if self._sentinel is not None:
+            return self._sentinel.insert_paragraph_before()
+        return doc.add_paragraph()
+
+    def _add_page_break(self, doc: "Document") -> None:
+        """添加只包含分页符的段落"""
+
+        self._add_paragraph(doc).add_run().add_break(WD_BREAK.PAGE)
+
+    def _add_table(self, doc: "Document", rows: int, cols: int):
+        """在正文末尾添加 rows x cols 的空表格"""
+
+        width = self._block_width if self._block_width is not None else doc._block_width
+        tbl = CT_Tbl.new_tbl(rows, cols, width)
+        self._insert_block(doc, tbl)
+        return DocxTable(tbl, doc._body)
+
     def _add_toc_field(self, doc: "Document") -> None:
         """添加目录域"""
-        from docx.oxml import OxmlElement
-        from docx.oxml.ns import qn
 
-        paragraph = doc.add_paragraph()
-        run = paragraph.add_run()
-        
-        # 创建复杂域
-        fldChar1 = OxmlElement('w:fldChar')
-        fldChar1.set(qn('w:fldCharType'), 'begin')
-        
-        instrText = OxmlElement('w:instrText')
-        instrText.set(qn('xml:space'), 'preserve')
-        instrText.text = 'TOC \\o "1-3" \\h \\z \\u'
-        
-        fldChar2 = OxmlElement('w:fldChar')
-        fldChar2.set(qn('w:fldCharType'), 'separate')
-        
-        fldChar3 = OxmlElement('w:fldChar')
-        fldChar3.set(qn('w:fldCharType'), 'end')
-        
-        run._r.append(fldChar1)
-        run._r.append(instrText)
-        run._r.append(fldChar2)
-        run._r.append(fldChar3)
+        paragraph = self._add_paragraph(doc)
+        # 复杂域（begin / instrText / separate / end）一次性由模板解析生成
+        paragraph._p.append(parse_xml(_TOC_FIELD_XML))
+
+    def _add_placeholder_paragraph(self, doc: "Document", text: str, size: int) -> None:
+        """按模板添加一个图表占位符段落（size 为磅值）"""
+
+        self._insert_block(doc, parse_xml(
+            _PLACEHOLDER_XML.format(size=size * 2, content=_run_content_xml(text))
+        ))
+
+    def _add_body_paragraphs(self, doc: "Document", texts: list[str]) -> None:
+        """把一批连续的正文段落拼成一个 XML 片段解析，再整体插入正文末尾"""
+        fragment = parse_xml(_BODY_PARAGRAPHS_XML.format(paragraphs="".join(
+            f"<w:p><w:r>{_run_content_xml(text)}</w:r></w:p>" for text in texts
+        )))
+        for paragraph in list(fragment):
+            self._insert_block(doc, paragraph)
 
     def _add_section_to_doc(
         self,
@@ -336,9 +876,6 @@ class WordExporter:
             keywords: 中文关键词列表，仅在摘要章节后输出
             keywords_en: 英文关键词列表，仅在英文摘要章节后输出
         """
-        from docx.shared import Pt, Cm, Inches
-        from docx.enum.text import WD_ALIGN_PARAGRAPH
-        from docx.oxml.ns import qn
 
         # 获取内容
         content = ""
@@ -347,40 +884,35 @@ class WordExporter:
         elif section.draft_latex:
             content = section.draft_latex
 
-        # 始终添加章节标题（不管内容中是否有子标题）
-        heading_level = min(level, 9)
-        heading = doc.add_heading(section.title, level=heading_level)
-        
-        # 设置标题字体
-        for run in heading.runs:
-            run.font.name = '黑体'
-            run._element.rPr.rFonts.set(qn('w:eastAsia'), '黑体')
-        
-        heading.paragraph_format.first_line_indent = Cm(0)
+        # 添加章节标题（不管内容中是否有子标题），空标题不生成空的标题段落
+        if section.title.strip():
+            heading_level = min(level, 9)
+            self._add_heading(doc, section.title, heading_level)
 
+        has_subsections_in_content = False
         if content:
             # 收集本章节及所有子章节的图片和表格
             all_figures = self._collect_all_figures(section)
             all_tables = self._collect_all_tables(section)
             # 解析 LaTeX 内容并添加到文档（包括处理 \subsection）
-            self._add_latex_content_to_doc(doc, content, level, all_figures, all_tables)
+            has_subsections_in_content = self._add_latex_content_to_doc(
+                doc, content, level, all_figures, all_tables
+            )
         
         # 如果是摘要章节，在内容后添加关键词
         if keywords and section.id in ("abstract-zh", "abstract", "摘要"):
-            kw_para = doc.add_paragraph()
+            kw_para = self._add_paragraph(doc)
             kw_bold = kw_para.add_run("关键词：")
             kw_bold.bold = True
             kw_bold.font.name = '宋体'
-            kw_bold._element.rPr.rFonts.set(qn('w:eastAsia'), '宋体')
             kw_run = kw_para.add_run("；".join(keywords))
             kw_run.font.name = '宋体'
-            kw_run._element.rPr.rFonts.set(qn('w:eastAsia'), '宋体')
             kw_para.paragraph_format.first_line_indent = Cm(0)
             kw_para.space_after = Pt(12)
         
         # 如果是英文摘要章节，在内容后添加 Keywords
         if keywords and section.id in ("abstract-en", "Abstract"):
-            kw_para = doc.add_paragraph()
+            kw_para = self._add_paragraph(doc)
             kw_bold = kw_para.add_run("Keywords: ")
             kw_bold.bold = True
             # 使用英文关键词（如果有），否则使用中文关键词
@@ -395,7 +927,6 @@ class WordExporter:
 
         # 递归处理子章节（如果没有内容或内容中没有\subsection）
         # 如果内容中已经包含\subsection，说明子标题已经在内容中了，不需要递归
-        has_subsections_in_content = bool(re.search(r"\\subsection\{", content))
         if not has_subsections_in_content:
             for child in section.children:
                 self._add_section_to_doc(doc, child, use_final, level + 1, keywords=keywords, keywords_en=keywords_en)
@@ -406,42 +937,8 @@ class WordExporter:
         figures: list[Figure],
     ) -> None:
         """添加图片到文档"""
-        from docx.shared import Pt, Cm, Inches
-        from docx.enum.text import WD_ALIGN_PARAGRAPH
-        from docx.oxml.ns import qn
-
         for figure in figures:
-            # 确定图片路径（智能处理路径重复）
-            image_path = self._resolve_image_path(figure.path)
-            
-            # 添加图片
-            if image_path.exists():
-                try:
-                    # 添加图片（宽度为页面宽度的 80%）
-                    para = doc.add_paragraph()
-                    para.alignment = WD_ALIGN_PARAGRAPH.CENTER
-                    run = para.add_run()
-                    run.add_picture(str(image_path), width=Inches(5))
-                    
-                    # 添加图片标题
-                    caption_para = doc.add_paragraph()
-                    caption_para.alignment = WD_ALIGN_PARAGRAPH.CENTER
-                    caption_run = caption_para.add_run(f"图 {figure.id}: {figure.caption}")
-                    caption_run.font.name = '宋体'
-                    caption_run.font.size = Pt(10)
-                    caption_run._element.rPr.rFonts.set(qn('w:eastAsia'), '宋体')
-                    caption_para.paragraph_format.first_line_indent = Cm(0)
-                    caption_para.space_after = Pt(12)
-                    
-                    console.print(f"[green]  ✓ 插入图片: {figure.caption}[/green]")
-                except Exception as e:
-                    console.print(f"[yellow]  ⚠ 图片插入失败 {figure.path}: {e}[/yellow]")
-                    # 添加占位符
-                    self._add_figure_placeholder(doc, figure)
-            else:
-                console.print(f"[yellow]  ⚠ 图片不存在: {image_path}[/yellow]")
-                # 添加占位符
-                self._add_figure_placeholder(doc, figure)
+            self._insert_figure(doc, figure)
 
     def _add_figure_placeholder(
         self,
@@ -449,28 +946,14 @@ class WordExporter:
         figure: Figure,
     ) -> None:
         """添加图片占位符"""
-        from docx.shared import Pt, Cm
-        from docx.enum.text import WD_ALIGN_PARAGRAPH
-        from docx.oxml.ns import qn
-
-        para = doc.add_paragraph()
-        para.alignment = WD_ALIGN_PARAGRAPH.CENTER
-        run = para.add_run(f"[图 {figure.id}: {figure.caption}]")
-        run.font.name = '宋体'
-        run.font.size = Pt(10)
-        run.italic = True
-        run._element.rPr.rFonts.set(qn('w:eastAsia'), '宋体')
-        para.paragraph_format.first_line_indent = Cm(0)
+        self._add_placeholder_paragraph(doc, f"[图 {figure.id}: {figure.caption}]", 10)
         
         if figure.description:
-            desc_para = doc.add_paragraph()
-            desc_para.alignment = WD_ALIGN_PARAGRAPH.CENTER
-            desc_run = desc_para.add_run(f"（{figure.description[:100]}...）" if len(figure.description) > 100 else f"（{figure.description}）")
-            desc_run.font.name = '宋体'
-            desc_run.font.size = Pt(9)
-            desc_run.italic = True
-            desc_run._element.rPr.rFonts.set(qn('w:eastAsia'), '宋体')
-            desc_para.paragraph_format.first_line_indent = Cm(0)
+            self._add_placeholder_paragraph(
+                doc,
+                f"（{figure.description[:100]}...）" if len(figure.description) > 100 else f"（{figure.description}）",
+                9,
+            )
 
     def _insert_table(
         self,
@@ -478,10 +961,6 @@ class WordExporter:
         table: Table,
     ) -> None:
         """插入表格到文档"""
-        from docx.shared import Pt, Cm
-        from docx.enum.text import WD_ALIGN_PARAGRAPH
-        from docx.enum.table import WD_TABLE_ALIGNMENT
-        from docx.oxml.ns import qn
         
         # 如果有 path，从 Excel 读取表格内容
         if table.path:
@@ -490,26 +969,28 @@ class WordExporter:
                 
                 # 确定表格路径（智能处理路径重复）
                 table_path = self._resolve_image_path(table.path)
+                rows = self._table_rows.get(table_path)
                 
-                if table_path.exists():
-                    rows = read_excel_file(table_path)
+                if rows is not None or table_path.exists():
+                    if rows is None:
+                        rows = read_excel_file(table_path)
                     if rows:
                         self._create_word_table(doc, rows, table)
-                        console.print(f"[green]  ✓ 插入表格: {table.caption}[/green]")
+                        self._insert_log.append(f"[green]  ✓ 插入表格: {table.caption}[/green]")
                         return
                     else:
-                        console.print(f"[yellow]  ⚠ 表格文件为空: {table_path}[/yellow]")
+                        self._insert_log.append(f"[yellow]  ⚠ 表格文件为空: {table_path}[/yellow]")
                 else:
-                    console.print(f"[yellow]  ⚠ 表格文件不存在: {table_path}[/yellow]")
+                    self._insert_log.append(f"[yellow]  ⚠ 表格文件不存在: {table_path}[/yellow]")
             except Exception as e:
-                console.print(f"[red]  ✗ 读取表格失败 {table.path}: {e}[/red]")
+                self._insert_log.append(f"[red]  ✗ 读取表格失败 {table.path}: {e}[/red]")
         
         # 如果有 content（Markdown 格式），解析并创建表格
         if table.content:
             rows = self._parse_markdown_table(table.content)
             if rows:
                 self._create_word_table(doc, rows, table)
-                console.print(f"[green]  ✓ 插入表格: {table.caption}[/green]")
+                self._insert_log.append(f"[green]  ✓ 插入表格: {table.caption}[/green]")
                 return
         
         # 否则添加占位符
@@ -522,10 +1003,6 @@ class WordExporter:
         table: Table,
     ) -> None:
         """创建 Word 表格"""
-        from docx.shared import Pt, Cm
-        from docx.enum.text import WD_ALIGN_PARAGRAPH
-        from docx.enum.table import WD_TABLE_ALIGNMENT
-        from docx.oxml.ns import qn
         
         if not rows:
             return
@@ -534,37 +1011,28 @@ class WordExporter:
         num_cols = max(len(row) for row in rows)
         
         # 创建表格
-        word_table = doc.add_table(rows=num_rows, cols=num_cols)
+        word_table = self._add_table(doc, num_rows, num_cols)
         word_table.style = 'Table Grid'
         word_table.alignment = WD_TABLE_ALIGNMENT.CENTER
         
-        # 填充表格内容
-        for i, row in enumerate(rows):
+        # 填充表格内容（每行的单元格列表只取一次）
+        for i, (row, word_row) in enumerate(zip(rows, word_table.rows)):
+            # 表头加粗
+            rpr = _HEADER_CELL_RPR if i == 0 else _CELL_RPR
+            cells = word_row.cells
             for j, cell_text in enumerate(row):
                 if j < num_cols:
-                    cell = word_table.rows[i].cells[j]
+                    cell = cells[j]
                     cell.text = cell_text
                     
-                    # 设置单元格字体
+                    # 设置单元格字体：复制预先解析好的 rPr
                     for paragraph in cell.paragraphs:
                         paragraph.alignment = WD_ALIGN_PARAGRAPH.CENTER
                         for run in paragraph.runs:
-                            run.font.name = '宋体'
-                            run.font.size = Pt(10)
-                            run._element.rPr.rFonts.set(qn('w:eastAsia'), '宋体')
-                            # 表头加粗
-                            if i == 0:
-                                run.bold = True
+                            run._r._insert_rPr(copy.deepcopy(rpr))
         
         # 添加表格标题（在表格下方）
-        caption_para = doc.add_paragraph()
-        caption_para.alignment = WD_ALIGN_PARAGRAPH.CENTER
-        caption_run = caption_para.add_run(f"表 {table.id}: {table.caption}")
-        caption_run.font.name = '宋体'
-        caption_run.font.size = Pt(10)
-        caption_run._element.rPr.rFonts.set(qn('w:eastAsia'), '宋体')
-        caption_para.paragraph_format.first_line_indent = Cm(0)
-        caption_para.space_after = Pt(12)
+        self._add_caption(doc, f"表 {table.id}: {table.caption}")
 
     def _parse_markdown_table(self, content: str) -> list[list[str]]:
         """解析 Markdown 格式的表格"""
@@ -589,28 +1057,14 @@ class WordExporter:
         table: Table,
     ) -> None:
         """添加表格占位符"""
-        from docx.shared import Pt, Cm
-        from docx.enum.text import WD_ALIGN_PARAGRAPH
-        from docx.oxml.ns import qn
-
-        para = doc.add_paragraph()
-        para.alignment = WD_ALIGN_PARAGRAPH.CENTER
-        run = para.add_run(f"[表 {table.id}: {table.caption}]")
-        run.font.name = '宋体'
-        run.font.size = Pt(10)
-        run.italic = True
-        run._element.rPr.rFonts.set(qn('w:eastAsia'), '宋体')
-        para.paragraph_format.first_line_indent = Cm(0)
+        self._add_placeholder_paragraph(doc, f"[表 {table.id}: {table.caption}]", 10)
         
         if table.description:
-            desc_para = doc.add_paragraph()
-            desc_para.alignment = WD_ALIGN_PARAGRAPH.CENTER
-            desc_run = desc_para.add_run(f"（{table.description[:100]}...）" if len(table.description) > 100 else f"（{table.description}）")
-            desc_run.font.name = '宋体'
-            desc_run.font.size = Pt(9)
-            desc_run.italic = True
-            desc_run._element.rPr.rFonts.set(qn('w:eastAsia'), '宋体')
-            desc_para.paragraph_format.first_line_indent = Cm(0)
+            self._add_placeholder_paragraph(
+                doc,
+                f"（{table.description[:100]}...）" if len(table.description) > 100 else f"（{table.description}）",
+                9,
+            )
 
     def _collect_all_figures(self, section: Section) -> list[Figure]:
         """递归收集章节及其所有子章节的图片"""
@@ -645,212 +1099,99 @@ class WordExporter:
         base_level: int = 1,
         figures: list[Figure] | None = None,
         tables: list[Table] | None = None,
-    ) -> None:
-        """将 LaTeX 内容转换并添加到 Word 文档"""
-        from docx.shared import Pt, Cm, Inches
-        from docx.enum.text import WD_ALIGN_PARAGRAPH
-        from docx.oxml.ns import qn
+    ) -> bool:
+        """将 LaTeX 内容转换并添加到 Word 文档
+
+        Returns:
+            内容中是否包含 \\subsection（子标题已在内容中输出）
+        """
 
         figures = figures or []
         tables = tables or []
-        figure_map = {f.id: f for f in figures}
-        # 同时用 caption 作为备用 key
+        # 占位符按标题查找，找不到时按顺序取第一个未插入的
+        caption_to_figure: dict[str, Figure] = {}
         for f in figures:
-            figure_map[f.caption] = f
-        table_map = {t.id: t for t in tables}
+            caption_to_figure.setdefault(f.caption, f)
+        caption_to_table: dict[str, Table] = {}
         for t in tables:
-            table_map[t.caption] = t
-        figures_inserted = set()
-        tables_inserted = set()
-
-        # 先处理 LaTeX 转义符号
-        content = latex_content
-        content = content.replace("\\%", "%")
-        content = content.replace("\\$", "$")
-        content = content.replace("\\&", "&")
-        content = content.replace("\\#", "#")
-        content = content.replace("\\_", "_")
-        content = content.replace("\\{", "{")
-        content = content.replace("\\}", "}")
-        
-        # 处理数学公式 $...$
-        content = re.sub(r"\$([^$]+)\$", r"\1", content)
-        
-        # 处理图表占位符 - 转换为特殊标记以便后续处理
-        content = re.sub(r"\{\{FIGURE:([^:]*):([^}]*)\}\}", r"\n\n<<FIGURE:\1:\2>>\n\n", content)
-        content = re.sub(r"\{\{TABLE:([^:]*):([^}]*)\}\}", r"\n\n<<TABLE:\1:\2>>\n\n", content)
-        
-        # 处理 \textbf{...} - 保留内容
-        content = re.sub(r"\\textbf\{([^}]*)\}", r"\1", content)
-        
-        # 处理 \textit{...} 和 \emph{...}
-        content = re.sub(r"\\textit\{([^}]*)\}", r"\1", content)
-        content = re.sub(r"\\emph\{([^}]*)\}", r"\1", content)
-        
-        # 处理 \cite{...}
-        content = re.sub(r"\\cite\{[^}]*\}", "[引用]", content)
-        
-        # 移除 \label{...} 和 \ref{...} 等引用命令（这些不应该出现在Word中）
-        content = re.sub(r"\\label\{[^}]*\}", "", content)
-        content = re.sub(r"\\ref\{[^}]*\}", "", content)
-        content = re.sub(r"\\pageref\{[^}]*\}", "", content)
-        content = re.sub(r"\\autoref\{[^}]*\}", "", content)
-        
-        # 使用特殊标记分割章节和内容
-        # 将 \section{...} \subsection{...} 等替换为特殊标记 (LaTeX格式)
-        content = re.sub(r"\\section\{([^}]*)\}", r"\n\n<<HEADING:1:\1>>\n\n", content)
-        content = re.sub(r"\\subsection\{([^}]*)\}", r"\n\n<<HEADING:2:\1>>\n\n", content)
-        content = re.sub(r"\\subsubsection\{([^}]*)\}", r"\n\n<<HEADING:3:\1>>\n\n", content)
-        
-        # 同时处理 Markdown 格式的标题
-        # ### 三级标题
-        content = re.sub(r"^### (.+)$", r"\n\n<<HEADING:3:\1>>\n\n", content, flags=re.MULTILINE)
-        # ## 二级标题
-        content = re.sub(r"^## (.+)$", r"\n\n<<HEADING:2:\1>>\n\n", content, flags=re.MULTILINE)
-        # # 一级标题 (章节主标题,通常已经在外面处理了,这里忽略)
-        content = re.sub(r"^# .+$", r"", content, flags=re.MULTILINE)
-        
-        # 移除其他 LaTeX 命令但保留内容
-        content = re.sub(r"\\[a-zA-Z]+\*?\{([^}]*)\}", r"\1", content)
-        content = re.sub(r"\\[a-zA-Z]+\*?", "", content)
-        content = re.sub(r"[{}]", "", content)
-        
-        # 移除残留的 sec: subsec: 等标签文本
-        content = re.sub(r"\b(sec|subsec|fig|tab|eq|chap):[a-zA-Z0-9_-]+\b", "", content)
-        
-        # 清理多余空行
-        content = re.sub(r"\n{3,}", "\n\n", content)
-        
-        # 按段落分割并添加
-        paragraphs = content.strip().split("\n\n")
-        for para_text in paragraphs:
-            para_text = para_text.strip()
-            
-            # 跳过空段落
-            if not para_text or len(para_text) < 2:
+            caption_to_table.setdefault(t.caption, t)
+        unused_figures = deque(figures)
+        unused_tables = deque(tables)
+        figures_inserted: set[int] = set()
+        tables_inserted: set[int] = set()
+
+        tokens, has_subsections = _tokenize_latex_content(latex_content)
+        # 连续的普通段落先攒起来，遇到其他内容或结束时一次性插入
+        pending_texts: list[str] = []
+        for kind, payload in tokens:
+            # 普通段落：字体、字号、首行缩进和行距都继承自 Normal 样式
+            if kind == "text":
+                pending_texts.append(payload)
                 continue
-            
-            # 检查是否是标题标记
-            heading_match = re.match(r"<<HEADING:(\d+):(.+)>>", para_text)
-            if heading_match:
-                heading_rel_level = int(heading_match.group(1))
-                heading_title = heading_match.group(2).strip()
+            if pending_texts:
+                self._add_body_paragraphs(doc, pending_texts)
+                pending_texts = []
+
+            # 标题
+            if kind == "heading":
+                heading_rel_level, heading_title = payload
                 # 计算实际的标题级别
                 actual_level = base_level + heading_rel_level - 1
                 actual_level = min(actual_level, 9)
                 
-                heading = doc.add_heading(heading_title, level=actual_level)
-                for run in heading.runs:
-                    run.font.name = '黑体'
-                    run._element.rPr.rFonts.set(qn('w:eastAsia'), '黑体')
-                heading.paragraph_format.first_line_indent = Cm(0)
+                self._add_heading(doc, heading_title, actual_level)
                 continue
             
-            # 检查是否是图片标记
-            figure_match = re.match(r"<<FIGURE:([^:]*):([^>]*)>>", para_text)
-            if figure_match:
-                fig_caption = figure_match.group(1).strip()
-                fig_desc = figure_match.group(2).strip()
+            # 图片标记
+            if kind == "figure":
+                fig_caption, fig_desc = payload
                 
                 # 尝试查找匹配的真实图片
-                matched_figure = None
-                for fig_id, fig in figure_map.items():
-                    if fig.caption == fig_caption or fig_id not in figures_inserted:
-                        matched_figure = fig
-                        figures_inserted.add(fig_id)
-                        break
+                matched_figure = _take_matching(
+                    fig_caption, caption_to_figure, unused_figures, figures_inserted
+                )
                 
                 if matched_figure:
                     # 插入真实图片
                     self._insert_figure(doc, matched_figure)
                 else:
                     # 添加占位符
-                    para = doc.add_paragraph()
-                    para.alignment = WD_ALIGN_PARAGRAPH.CENTER
-                    run = para.add_run(f"[图: {fig_caption}]")
-                    run.font.name = '宋体'
-                    run.font.size = Pt(10)
-                    run.italic = True
-                    run._element.rPr.rFonts.set(qn('w:eastAsia'), '宋体')
-                    para.paragraph_format.first_line_indent = Cm(0)
-                    
+                    self._add_placeholder_paragraph(doc, f"[图: {fig_caption}]", 10)
                     if fig_desc:
-                        desc_para = doc.add_paragraph()
-                        desc_para.alignment = WD_ALIGN_PARAGRAPH.CENTER
-                        desc_run = desc_para.add_run(f"说明: {fig_desc}")
-                        desc_run.font.name = '宋体'
-                        desc_run.font.size = Pt(9)
-                        desc_run.italic = True
-                        desc_run._element.rPr.rFonts.set(qn('w:eastAsia'), '宋体')
-                        desc_para.paragraph_format.first_line_indent = Cm(0)
+                        self._add_placeholder_paragraph(doc, f"说明: {fig_desc}", 9)
                 continue
             
-            # 检查是否是表格标记
-            table_match = re.match(r"<<TABLE:([^:]*):([^>]*)>>", para_text)
-            if table_match:
-                tab_caption = table_match.group(1).strip()
-                tab_desc = table_match.group(2).strip()
+            # 表格标记
+            if kind == "table":
+                tab_caption, tab_desc = payload
                 
                 # 尝试查找匹配的真实表格
-                matched_table = None
-                for tab_key, tab in table_map.items():
-                    if tab.caption == tab_caption or tab_key not in tables_inserted:
-                        matched_table = tab
-                        tables_inserted.add(tab.id)
-                        tables_inserted.add(tab.caption)
-                        break
+                matched_table = _take_matching(
+                    tab_caption, caption_to_table, unused_tables, tables_inserted
+                )
                 
                 if matched_table:
                     # 插入真实表格
                     self._insert_table(doc, matched_table)
                 else:
                     # 添加占位符
-                    para = doc.add_paragraph()
-                    para.alignment = WD_ALIGN_PARAGRAPH.CENTER
-                    run = para.add_run(f"[表: {tab_caption}]")
-                    run.font.name = '宋体'
-                    run.font.size = Pt(10)
-                    run.italic = True
-                    run._element.rPr.rFonts.set(qn('w:eastAsia'), '宋体')
-                    para.paragraph_format.first_line_indent = Cm(0)
-                    
+                    self._add_placeholder_paragraph(doc, f"[表: {tab_caption}]", 10)
                     if tab_desc:
-                        desc_para = doc.add_paragraph()
-                        desc_para.alignment = WD_ALIGN_PARAGRAPH.CENTER
-                        desc_run = desc_para.add_run(f"说明: {tab_desc}")
-                        desc_run.font.name = '宋体'
-                        desc_run.font.size = Pt(9)
-                        desc_run.italic = True
-                        desc_run._element.rPr.rFonts.set(qn('w:eastAsia'), '宋体')
-                        desc_para.paragraph_format.first_line_indent = Cm(0)
+                        self._add_placeholder_paragraph(doc, f"说明: {tab_desc}", 9)
                 continue
-            
-            # 合并段落内的换行
-            para_text = re.sub(r"\s*\n\s*", " ", para_text)
-            para_text = re.sub(r"\s+", " ", para_text).strip()
-            
-            # 普通段落
-            para = doc.add_paragraph()
-            run = para.add_run(para_text)
-            run.font.name = '宋体'
-            run.font.size = Pt(12)
-            run._element.rPr.rFonts.set(qn('w:eastAsia'), '宋体')
-            para.paragraph_format.first_line_indent = Cm(0.74)  # 首行缩进
-            para.paragraph_format.line_spacing = 1.5
-        
-        # 插入剩余未插入的图片（在内容末尾）
-        for fig in figures:
-            if fig.id not in figures_inserted and fig.caption not in figures_inserted:
-                self._insert_figure(doc, fig)
-                figures_inserted.add(fig.id)
-                figures_inserted.add(fig.caption)
-        
-        # 插入剩余未插入的表格（在内容末尾）
-        for tab in tables:
-            if tab.id not in tables_inserted and tab.caption not in tables_inserted:
-                self._insert_table(doc, tab)
-                tables_inserted.add(tab.id)
-                tables_inserted.add(tab.caption)
+
+        if pending_texts:
+            self._add_body_paragraphs(doc, pending_texts)
+        
+        # 插入剩余未插入的图片和表格（在内容末尾），先一次性筛出剩余项再逐个插入
+        remaining_figures = [fig for fig in figures if id(fig) not in figures_inserted]
+        remaining_tables = [tab for tab in tables if id(tab) not in tables_inserted]
+        for fig in remaining_figures:
+            self._insert_figure(doc, fig)
+        for tab in remaining_tables:
+            self._insert_table(doc, tab)
+
+        return has_subsections
 
     def _insert_figure(
         self,
@@ -858,65 +1199,43 @@ class WordExporter:
         figure: Figure,
     ) -> None:
         """插入单张图片"""
-        from docx.shared import Pt, Cm, Inches
-        from docx.enum.text import WD_ALIGN_PARAGRAPH
-        from docx.oxml.ns import qn
 
-        # 检查 path 是否存在且有效
-        if not figure.path or figure.path.strip() in ('', '.', '..'):
-            console.print(f"[yellow]  ⚠ 图片未指定路径: {figure.caption}[/yellow]")
+        # 路径校验和解析结果在预读阶段已缓存，这里不再访问文件系统
+        image_path, exists = self._figure_image(figure)
+        if image_path is None:
+            self._insert_log.append(f"[yellow]  ⚠ 图片未指定路径: {figure.caption}[/yellow]")
             self._add_figure_placeholder(doc, figure)
             return
 
-        # 确定图片路径（智能处理路径重复）
-        image_path = self._resolve_image_path(figure.path)
-        
-        if image_path.exists():
-            try:
-                # 添加图片
-                para = doc.add_paragraph()
-                para.alignment = WD_ALIGN_PARAGRAPH.CENTER
-                run = para.add_run()
-                run.add_picture(str(image_path), width=Inches(5))
-                
-                # 添加图片标题
-                caption_para = doc.add_paragraph()
-                caption_para.alignment = WD_ALIGN_PARAGRAPH.CENTER
-                caption_run = caption_para.add_run(f"图 {figure.id}: {figure.caption}")
-                caption_run.font.name = '宋体'
-                caption_run.font.size = Pt(10)
-                caption_run._element.rPr.rFonts.set(qn('w:eastAsia'), '宋体')
-                caption_para.paragraph_format.first_line_indent = Cm(0)
-                caption_para.space_after = Pt(12)
-                
-                console.print(f"[green]  ✓ 插入图片: {figure.caption}[/green]")
-            except Exception as e:
-                console.print(f"[yellow]  ⚠ 图片插入失败 {figure.path}: {e}[/yellow]")
-                self._add_figure_placeholder(doc, figure)
-        else:
-            console.print(f"[yellow]  ⚠ 图片不存在: {image_path}[/yellow]")
+        if not exists:
+            self._insert_log.append(f"[yellow]  ⚠ 图片不存在: {image_path}[/yellow]")
             self._add_figure_placeholder(doc, figure)
+            return
 
-    def _strip_latex_commands(self, text: str) -> str:
-        """移除 LaTeX 命令，保留文本内容"""
-        import re
+        # 预读阶段已校验过图片，校验失败的直接走占位符
+        error = self._image_errors.get(image_path)
+        if error is not None:
+            self._insert_log.append(f"[yellow]  ⚠ 图片插入失败 {figure.path}: {error}[/yellow]")
+            self._add_figure_placeholder(doc, figure)
+            return
 
-        # 移除 \section{}, \subsection{} 等命令
-        text = re.sub(r"\\(sub)*section\{[^}]*\}", "", text)
-        
-        # 移除 \textbf{...} 但保留内容
-        text = re.sub(r"\\textbf\{([^}]*)\}", r"\1", text)
-        text = re.sub(r"\\textit\{([^}]*)\}", r"\1", text)
-        text = re.sub(r"\\emph\{([^}]*)\}", r"\1", text)
-        
-        # 移除 \cite{...}
-        text = re.sub(r"\\cite\{[^}]*\}", "[引用]", text)
+        # 添加图片
+        para = self._add_paragraph(doc)
+        para.alignment = WD_ALIGN_PARAGRAPH.CENTER
+        run = para.add_run()
+        self._add_picture(run, image_path)
         
-        # 移除其他常见命令
-        text = re.sub(r"\\[a-zA-Z]+\{[^}]*\}", "", text)
-        text = re.sub(r"\\[a-zA-Z]+", "", text)
+        # 添加图片标题
+        self._add_caption(doc, f"图 {figure.id}: {figure.caption}")
         
+        self._insert_log.append(f"[green]  ✓ 插入图片: {figure.caption}[/green]")
+
+    def _strip_latex_commands(self, text: str) -> str:
+        """移除 LaTeX 命令，保留文本内容"""
+        # 单次扫描：格式命令保留内容，\cite 替换为 [引用]，其余命令（含章节命令）移除
+        text = _RE_LATEX_STRIP.sub(_strip_latex_match, text)
+
         # 清理多余空白
-        text = re.sub(r"\n{3,}", "\n\n", text)
+        text = _RE_BLANK_LINES.sub("\n\n", text)
 
         return text.strip()
@@ -7,24 +7,32 @@ AIWrite 交互式终端界面 (TUI)
 from __future__ import annotations
 
 import asyncio
+import functools
+import json
+import os
+import re
+import shutil
+import subprocess
 import sys
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import Optional, List
+from typing import TYPE_CHECKING, Callable, NamedTuple, Optional, List
 
 import questionary
 from rich.console import Console
 from rich.panel import Panel
 from rich.table import Table
-from rich.progress import Progress, SpinnerColumn, TextColumn
+from rich.progress import BarColumn, Progress, SpinnerColumn, TextColumn
 
 from .config import (
+    AppConfig,
     load_config,
     load_outline,
     save_outline,
     create_thinking_provider,
     create_writing_provider,
 )
-from .models import Paper, PaperStatus, PipelineContext, LLMOptions, FigureType
+from .models import Paper, Section, Figure, PaperStatus, PipelineContext, LLMOptions, FigureType
 from .pipeline import (
     OutlineSuggestStep,
     SectionDraftStep,
@@ -32,20 +40,217 @@ from .pipeline import (
     AbstractGenerateStep,
 )
 from .pipeline.init_step import OutlineInitializer
-from .render import LatexRenderer, WordExporter
+
+if TYPE_CHECKING:
+    from .render import LatexRenderer, WordExporter
 
 console = Console()
 
+# 批量生成图片时同时渲染的 Mermaid 图数量（共用一个浏览器）
+_MAX_CONCURRENT_RENDERS = 4
+
+# 项目选择菜单每页显示的项目数
+_PROJECT_PAGE_SIZE = 15
+
+# 由论文标题生成默认文件名时替换掉的字符
+_FILENAME_TABLE = str.maketrans({" ": "_", "/": "_", "\\": "_", ":": "_"})
+
+# 去掉用户输入路径首尾的空白和引号（拖入文件时终端常会自动加引号）
+_PATH_QUOTES_RE = re.compile(r"^[\s\"']+|[\s\"']+$")
+
+# 大纲预览中的图片状态图标：(图标, 颜色, 说明)
+_FIG_ICONS = {
+    FigureType.MATCHED: ("✓", "green", "已匹配"),
+    FigureType.GENERATE: ("🔧", "blue", "可生成"),
+    FigureType.SUGGESTED: ("💡", "yellow", "建议补充"),
+    FigureType.MISSING: ("⚠", "red", "待补充"),
+}
+# 预先拼好每种图片状态的 Rich 标记
+_FIG_MARKUP = {ft: f"[{color}]{icon}[/{color}]" for ft, (icon, color, _) in _FIG_ICONS.items()}
+
+# 处理图片建议时待处理图片的图标：(图标, 颜色, 说明)
+_TYPE_ICONS = {
+    FigureType.GENERATE: ("🔧", "blue", "可自动生成"),
+    FigureType.MISSING: ("⚠", "yellow", "用户标注需要"),
+}
+
 
 def has_abstract(paper: Paper) -> bool:
     """检查论文是否已有摘要"""
     for section in paper.sections:
-        title_lower = section.title.lower()
-        if "摘要" in title_lower and section.final_latex:
+        if section.final_latex and "摘要" in section.title:
             return True
     return bool(paper.abstract_cn)
 
 
+def _bucket_figures(sections: List[Section]) -> tuple[List[Figure], List[Figure], List[Figure]]:
+    """一次遍历把图片分成 (可生成, 建议补充, 待补充) 三组"""
+    buckets: dict[FigureType, List[Figure]] = {
+        FigureType.GENERATE: [],
+        FigureType.SUGGESTED: [],
+        FigureType.MISSING: [],
+    }
+    for section in sections:
+        for fig in section.figures:
+            bucket = buckets.get(fig.fig_type)
+            if bucket is not None:
+                bucket.append(fig)
+    return buckets[FigureType.GENERATE], buckets[FigureType.SUGGESTED], buckets[FigureType.MISSING]
+
+
+class _PaperProgress(NamedTuple):
+    """论文当前进度：还需要执行哪些步骤"""
+    generate_figs: List[Figure]
+    need_draft: bool
+    need_refine: bool
+    has_abstract: bool
+
+
+def _paper_progress(paper: Paper, all_sections: List[Section] | None = None) -> _PaperProgress:
+    """一次遍历统计可生成图片和草稿/润色进度（可传入已展开的全部章节）"""
+    if all_sections is None:
+        all_sections = paper.get_all_sections()
+    generate_figs, _, _ = _bucket_figures(all_sections)
+    
+    # 注意：内容存储在主章节（level==1），子节不存储内容
+    need_draft = need_refine = False
+    for section in all_sections:
+        if section.level != 1:
+            continue
+        if not section.draft_latex:
+            need_draft = True
+        elif not section.final_latex:
+            need_refine = True
+        if need_draft and need_refine:
+            break
+    
+    return _PaperProgress(generate_figs, need_draft, need_refine, has_abstract(paper))
+
+
+@functools.lru_cache(maxsize=1)
+def _get_latex_renderer() -> LatexRenderer:
+    """LaTeX 渲染器只创建一次，避免每次导出重新编译 Jinja 模板"""
+    # 渲染模块依赖 python-docx / jinja2，导入较慢，用到时再导入
+    from .render import LatexRenderer
+    return LatexRenderer()
+
+
+@functools.lru_cache(maxsize=4)
+def _get_word_exporter(images_base_path: str | None) -> WordExporter:
+    """按图片目录缓存 Word 导出器（每次导出开始时会重置其内部的单次导出状态）"""
+    from .render import WordExporter
+    return WordExporter(images_base_path=Path(images_base_path) if images_base_path else None)
+
+
+def _find_project_files(*, skip_templates: bool = False) -> list[tuple[Path, os.stat_result]]:
+    """扫描当前目录和 examples/ 下的 YAML 项目文件，返回 (路径, stat)，最近修改的排在前面"""
+    entries: list[tuple[Path, os.stat_result]] = []
+    for directory in (".", "examples"):
+        try:
+            with os.scandir(directory) as it:
+                for entry in it:
+                    name = entry.name
+                    if not name.endswith(".yaml") or name.startswith("."):
+                        continue
+                    if skip_templates and name.startswith("_template"):
+                        continue
+                    if entry.is_file():
+                        entries.append((Path(entry.path), entry.stat()))
+        except FileNotFoundError:
+            continue
+    entries.sort(key=lambda e: e[1].st_mtime_ns, reverse=True)
+    return entries
+
+
+class _ProjectSummary(NamedTuple):
+    """项目列表中展示用的大纲摘要"""
+    title: str
+    status: str
+    total: int
+    drafted: int
+    refined: int
+
+
+# 项目列表摘要的磁盘缓存：{路径: {mtime_ns, size, summary}}，YAML 未变化时不再重新解析
+_SUMMARY_CACHE_FILE = Path(".aiwrite_cache.json")
+_summary_cache: dict[str, dict] | None = None
+
+
+def _get_summary_cache() -> dict[str, dict]:
+    """读取摘要缓存（进程内只读一次磁盘），缓存损坏或格式不对时视为空"""
+    global _summary_cache
+    if _summary_cache is None:
+        try:
+            _summary_cache = json.loads(_SUMMARY_CACHE_FILE.read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            _summary_cache = {}
+        if not isinstance(_summary_cache, dict):
+            _summary_cache = {}
+    return _summary_cache
+
+
+def _save_summary_cache():
+    """原子写回摘要缓存，写失败（如目录只读）时静默跳过"""
+    tmp_path = _SUMMARY_CACHE_FILE.with_name(_SUMMARY_CACHE_FILE.name + ".tmp")
+    try:
+        tmp_path.write_text(json.dumps(_get_summary_cache(), ensure_ascii=False), encoding="utf-8")
+        os.replace(tmp_path, _SUMMARY_CACHE_FILE)
+    except OSError:
+        pass
+
+
+def _forget_project_summary(path: Path):
+    """项目被修改或删除后丢弃其缓存摘要"""
+    if _get_summary_cache().pop(str(path), None) is not None:
+        _save_summary_cache()
+
+
+def _parse_project_summary(path: Path) -> _ProjectSummary | None:
+    """解析 YAML 计算摘要，解析失败返回 None"""
+    try:
+        paper = load_outline(path)
+    except Exception:
+        return None
+    return _ProjectSummary(
+        title=paper.title,
+        status=paper.status.value,
+        total=len(paper.sections),
+        drafted=sum(1 for s in paper.sections if s.draft_latex),
+        refined=sum(1 for s in paper.sections if s.final_latex),
+    )
+
+
+def _load_project_summaries(
+    files: list[tuple[Path, os.stat_result]],
+) -> list[tuple[Path, _ProjectSummary | None]]:
+    """批量读取项目摘要（stat 来自扫描结果，不再重复 stat），按原顺序返回 (路径, 摘要或 None)"""
+    cache = _get_summary_cache()
+    results: dict[Path, _ProjectSummary | None] = {}
+    stale: list[tuple[Path, tuple[int, int]]] = []
+    for path, st in files:
+        key = (st.st_mtime_ns, st.st_size)
+        entry = cache.get(str(path))
+        try:
+            if (entry["mtime_ns"], entry["size"]) == key:
+                summary = entry["summary"]
+                results[path] = _ProjectSummary(*summary) if summary is not None else None
+                continue
+        except (KeyError, TypeError, ValueError):
+            # 没有缓存，或条目格式不对（旧版本或手工修改的缓存文件），按过期处理重新解析
+            pass
+        stale.append((path, key))
+    
+    if stale:
+        with ThreadPoolExecutor(max_workers=8) as executor:
+            parsed = executor.map(_parse_project_summary, [path for path, _ in stale])
+            for (path, (mtime_ns, size)), summary in zip(stale, parsed):
+                results[path] = summary
+                cache[str(path)] = {"mtime_ns": mtime_ns, "size": size, "summary": summary}
+        _save_summary_cache()
+    
+    return [(path, results[path]) for path, _ in files]
+
+
 # 自定义样式
 STYLE = questionary.Style([
     ("qmark", "fg:cyan bold"),
@@ -57,6 +262,60 @@ STYLE = questionary.Style([
 ])
 
 
+def _open_path(path: str | Path):
+    """用系统默认程序打开文件或目录（不经过 shell，也不等待程序退出）"""
+    try:
+        if sys.platform == "win32":
+            os.startfile(path)
+        elif sys.platform == "darwin":
+            subprocess.Popen(["open", str(path)])
+        else:
+            subprocess.Popen(["xdg-open", str(path)])
+    except OSError as e:
+        console.print(f"[yellow]无法打开 {path}: {e}[/yellow]")
+
+
+def _open_in_editor(path: str | Path):
+    """用 VS Code 打开文件，找不到 code 命令时退回系统默认程序"""
+    # Windows 上 code 是 code.cmd，需要先解析出完整路径才能不经过 shell 启动
+    code = shutil.which("code")
+    if code:
+        subprocess.Popen([code, str(path)])
+    else:
+        _open_path(path)
+
+
+def _select_project(
+    message: str,
+    files: list[tuple[Path, os.stat_result]],
+    format_choice: Callable[[Path, _ProjectSummary | None], questionary.Choice],
+    extra_choices: list[questionary.Choice],
+) -> str | None:
+    """分页选择项目：只读取当前页的项目摘要，项目较多时提供翻页选项"""
+    page = 0
+    page_count = max(1, -(-len(files) // _PROJECT_PAGE_SIZE))
+    while True:
+        start = page * _PROJECT_PAGE_SIZE
+        choices = [
+            format_choice(f, summary)
+            for f, summary in _load_project_summaries(files[start:start + _PROJECT_PAGE_SIZE])
+        ]
+        if page + 1 < page_count:
+            choices.append(questionary.Choice("⏭️  下一页", value="next_page"))
+        if page > 0:
+            choices.append(questionary.Choice("⏮️  上一页", value="prev_page"))
+        choices.extend(extra_choices)
+        
+        title = message if page_count == 1 else f"{message}（第 {page + 1}/{page_count} 页）"
+        selected = questionary.select(title, choices=choices, style=STYLE).ask()
+        if selected == "next_page":
+            page += 1
+        elif selected == "prev_page":
+            page -= 1
+        else:
+            return selected
+
+
 def clear_screen():
     """清屏"""
     console.clear()
@@ -132,7 +391,7 @@ def new_paper_flow():
         ).ask()
         if images_dir:
             # 去掉用户可能输入的引号
-            images_dir = images_dir.strip().strip('"').strip("'")
+            images_dir = _PATH_QUOTES_RE.sub("", images_dir)
     
     # 4. 大纲输入方式
     outline_method = questionary.select(
@@ -154,7 +413,7 @@ def new_paper_flow():
         ).ask()
         if outline_file:
             # 去掉用户可能输入的引号
-            outline_file = outline_file.strip().strip('"').strip("'")
+            outline_file = _PATH_QUOTES_RE.sub("", outline_file)
             if Path(outline_file).exists():
                 outline_text = Path(outline_file).read_text(encoding="utf-8")
             else:
@@ -177,24 +436,17 @@ def new_paper_flow():
         outline_text = get_template(template_type)
         
     elif outline_method == "manual":
-        console.print("[dim]请输入大纲（每行一个章节，输入空行两次或输入 END 结束）：[/dim]")
-        lines = []
-        empty_count = 0
-        try:
-            while True:
-                line = input()
-                if line.strip().upper() == "END":
-                    break
-                if line.strip() == "":
-                    empty_count += 1
-                    if empty_count >= 2:
-                        break
-                    lines.append(line)
-                else:
-                    empty_count = 0
-                    lines.append(line)
-        except EOFError:
-            pass
+        # 用 prompt_toolkit 的多行编辑器一次读入整段大纲，粘贴长文本时不会逐行读取或丢字符
+        text = questionary.text(
+            "请输入大纲（每行一个章节）：",
+            multiline=True,
+            instruction="（Esc 后回车 或 Alt+Enter 结束）",
+            style=STYLE,
+        ).ask()
+        lines = (text or "").splitlines()
+        # 兼容以前用 END 结束输入的习惯
+        if lines and lines[-1].strip().upper() == "END":
+            lines.pop()
         outline_text = "\n".join(lines).strip()
     
     if not outline_text:
@@ -202,7 +454,7 @@ def new_paper_flow():
         return
     
     # 5. 输出文件名
-    default_filename = title.replace(" ", "_").replace("/", "_")[:30] + ".yaml"
+    default_filename = title.translate(_FILENAME_TABLE)[:30] + ".yaml"
     output_file = questionary.text(
         "保存配置文件名：",
         default=default_filename,
@@ -215,11 +467,13 @@ def new_paper_flow():
     output_path = Path(output_file)
     
     # 6. 确认信息
-    console.print("\n[bold]确认信息：[/bold]")
-    console.print(f"  标题：{title}")
-    console.print(f"  字数：{target_words}")
-    console.print(f"  图片：{images_dir or '无'}")
-    console.print(f"  输出：{output_path}")
+    console.print(
+        "\n[bold]确认信息：[/bold]\n"
+        f"  标题：{title}\n"
+        f"  字数：{target_words}\n"
+        f"  图片：{images_dir or '无'}\n"
+        f"  输出：{output_path}"
+    )
     
     confirm = questionary.confirm(
         "\n确认开始生成？",
@@ -283,16 +537,11 @@ def new_paper_flow():
     console.print(f"\n[green]✓ 配置已保存到: {output_path}[/green]")
     
     # 显示大纲预览
-    display_outline_preview(paper)
+    all_sections = paper.get_all_sections()
+    display_outline_preview(paper, all_sections=all_sections)
     
     # 统计图片建议
-    all_figures = []
-    for section in paper.get_all_sections():
-        all_figures.extend(section.figures)
-    
-    generate_figs = [f for f in all_figures if getattr(f, 'fig_type', None) == FigureType.GENERATE]
-    suggested_figs = [f for f in all_figures if getattr(f, 'fig_type', None) == FigureType.SUGGESTED]
-    missing_figs = [f for f in all_figures if getattr(f, 'fig_type', None) == FigureType.MISSING]
+    generate_figs, suggested_figs, missing_figs = _bucket_figures(all_sections)
     
     # 8. 下一步选项（根据图片情况动态调整）
     choices = []
@@ -327,9 +576,8 @@ def new_paper_flow():
     ).ask()
     
     if next_action == "process_figures":
+        # 处理结果直接写回内存中的 paper（有变化时同时保存到文件），无需重新加载
         process_figure_suggestions(paper, output_path, images_dir)
-        # 处理完后重新加载并继续
-        paper = load_outline(output_path)
         next_action = questionary.select(
             "\n下一步：",
             choices=[
@@ -356,10 +604,9 @@ def new_paper_flow():
     
     if next_action == "edit":
         # 打开 YAML 文件进行编辑
-        import subprocess
         console.print(f"[dim]正在打开编辑器: {output_path}[/dim]")
         try:
-            subprocess.run(["code", str(output_path)], shell=True)
+            _open_in_editor(output_path)
             questionary.press_any_key_to_continue("编辑完成后按任意键继续...").ask()
             paper = load_outline(output_path)
             display_outline_preview(paper)
@@ -367,9 +614,9 @@ def new_paper_flow():
             console.print(f"[red]无法打开编辑器: {e}[/red]")
     
     if next_action == "draft":
-        generate_draft_flow(output_path, images_dir)
+        generate_draft_flow(output_path, images_dir, paper=paper, config=config)
     elif next_action == "all":
-        full_pipeline_flow(output_path, images_dir)
+        full_pipeline_flow(output_path, images_dir, paper=paper, config=config)
 
 
 def continue_paper_flow():
@@ -377,40 +624,32 @@ def continue_paper_flow():
     console.print("\n[bold cyan]━━━ 📂 继续写作 ━━━[/bold cyan]\n")
     
     # 扫描已有的 YAML 文件
-    yaml_files = list(Path(".").glob("*.yaml")) + list(Path("examples").glob("*.yaml"))
+    yaml_files = _find_project_files()
     
     if not yaml_files:
         console.print("[yellow]未找到任何 YAML 配置文件[/yellow]")
         console.print("[dim]请先使用「新建论文」创建配置[/dim]")
         return
     
-    # 构建选项
-    choices = []
-    for f in yaml_files[:20]:  # 最多显示 20 个
-        try:
-            paper = load_outline(f)
-            status_icon = {
-                PaperStatus.PENDING_OUTLINE: "⏳",
-                PaperStatus.PENDING_CONFIRMATION: "📋",
-                PaperStatus.OUTLINE_CONFIRMED: "✅",
-                PaperStatus.DRAFT: "✏️",
-                PaperStatus.FINAL: "✨",
-            }.get(paper.status, "📄")
-            choices.append(questionary.Choice(
-                f"{status_icon} {paper.title[:40]} ({f.name})",
-                value=str(f),
-            ))
-        except Exception:
-            choices.append(questionary.Choice(f"❓ {f.name}", value=str(f)))
-    
-    choices.append(questionary.Choice("📁 输入其他路径", value="other"))
-    choices.append(questionary.Choice("↩️  返回", value="back"))
+    def format_choice(f: Path, summary: _ProjectSummary | None) -> questionary.Choice:
+        if summary is None:
+            return questionary.Choice(f"❓ {f.name}", value=str(f))
+        status_icon = {
+            PaperStatus.PENDING_OUTLINE: "⏳",
+            PaperStatus.PENDING_CONFIRMATION: "📋",
+            PaperStatus.OUTLINE_CONFIRMED: "✅",
+            PaperStatus.DRAFT: "✏️",
+            PaperStatus.FINAL: "✨",
+        }.get(summary.status, "📄")
+        return questionary.Choice(
+            f"{status_icon} {summary.title[:40]} ({f.name})",
+            value=str(f),
+        )
     
-    selected = questionary.select(
-        "选择项目：",
-        choices=choices,
-        style=STYLE,
-    ).ask()
+    selected = _select_project("选择项目：", yaml_files, format_choice, [
+        questionary.Choice("📁 输入其他路径", value="other"),
+        questionary.Choice("↩️  返回", value="back"),
+    ])
     
     if selected == "back":
         return
@@ -431,21 +670,11 @@ def continue_paper_flow():
     # 显示当前状态
     console.print(f"\n[bold]{paper.title}[/bold]")
     console.print(f"状态: {paper.status.value}")
-    display_outline_preview(paper)
-    
-    # 根据实际内容状态判断需要什么步骤
-    # 注意：内容存储在主章节（level==1），子节不存储内容
     all_sections = paper.get_all_sections()
-    main_chapters = [s for s in all_sections if s.level == 1]
-    need_draft = any(not s.draft_latex for s in main_chapters)
-    need_refine = any(s.draft_latex and not s.final_latex for s in main_chapters)
-    has_abstract_done = has_abstract(paper)
+    display_outline_preview(paper, all_sections=all_sections)
     
-    # 检查是否有可生成的图片
-    all_figures = []
-    for section in all_sections:
-        all_figures.extend(section.figures)
-    generate_figs = [f for f in all_figures if getattr(f, 'fig_type', None) == FigureType.GENERATE]
+    # 根据实际内容状态判断需要什么步骤，以及是否有可生成的图片
+    generate_figs, need_draft, need_refine, has_abstract_done = _paper_progress(paper, all_sections)
     
     # 判断是否有剩余流程
     remaining_steps = []
@@ -501,27 +730,34 @@ def continue_paper_flow():
     
     if action == "process_figures":
         process_figure_suggestions(paper, file_path, None)
-        paper = load_outline(file_path)
     elif action == "draft":
-        generate_draft_flow(file_path, None)
+        generate_draft_flow(file_path, None, paper=paper)
     elif action == "refine":
-        refine_flow(file_path, None)
+        refine_flow(file_path, None, paper=paper)
     elif action == "all":
-        full_pipeline_flow(file_path, None)
+        full_pipeline_flow(file_path, None, paper=paper)
     elif action == "export":
-        export_flow(file_path, None)
+        export_flow(file_path, None, paper=paper)
     elif action == "status":
         show_detailed_status(paper)
     elif action == "manage":
-        manage_project(file_path)
+        manage_project(file_path, paper=paper)
 
 
-def generate_draft_flow(file_path: Path, images_dir: str | None = None):
-    """生成草稿流程"""
+def generate_draft_flow(
+    file_path: Path,
+    images_dir: str | None = None,
+    *,
+    paper: Paper | None = None,
+    config: AppConfig | None = None,
+):
+    """生成草稿流程（可传入调用方已加载的 paper / config，避免重复解析）"""
     console.print("\n[bold cyan]━━━ ✏️ 生成草稿 ━━━[/bold cyan]\n")
     
-    paper = load_outline(file_path)
-    config = load_config()
+    if paper is None:
+        paper = load_outline(file_path)
+    if config is None:
+        config = load_config()
     writing_provider = create_writing_provider(config)
     
     console.print(f"[dim]使用模型: {writing_provider.model}[/dim]\n")
@@ -570,17 +806,25 @@ def generate_draft_flow(file_path: Path, images_dir: str | None = None):
     ).ask()
     
     if next_action == "refine":
-        refine_flow(file_path, images_dir)
+        refine_flow(file_path, images_dir, paper=paper, config=config)
     elif next_action == "export":
-        export_flow(file_path, images_dir)
+        export_flow(file_path, images_dir, paper=paper, config=config)
 
 
-def refine_flow(file_path: Path, images_dir: str | None = None):
-    """润色流程"""
+def refine_flow(
+    file_path: Path,
+    images_dir: str | None = None,
+    *,
+    paper: Paper | None = None,
+    config: AppConfig | None = None,
+):
+    """润色流程（可传入调用方已加载的 paper / config，避免重复解析）"""
     console.print("\n[bold cyan]━━━ ✨ 润色内容 ━━━[/bold cyan]\n")
     
-    paper = load_outline(file_path)
-    config = load_config()
+    if paper is None:
+        paper = load_outline(file_path)
+    if config is None:
+        config = load_config()
     writing_provider = create_writing_provider(config)
     
     step = SectionRefineStep(writing_provider)
@@ -608,14 +852,21 @@ def refine_flow(file_path: Path, images_dir: str | None = None):
     
     # 下一步
     if questionary.confirm("是否导出 Word？", default=True, style=STYLE).ask():
-        export_flow(file_path, images_dir)
+        export_flow(file_path, images_dir, paper=paper, config=config)
 
 
-def export_flow(file_path: Path, images_dir: Optional[str] = None):
-    """导出流程"""
+def export_flow(
+    file_path: Path,
+    images_dir: Optional[str] = None,
+    *,
+    paper: Paper | None = None,
+    config: AppConfig | None = None,
+):
+    """导出流程（可传入调用方已加载的 paper / config，避免重复解析）"""
     console.print("\n[bold cyan]━━━ 📄 导出文档 ━━━[/bold cyan]\n")
     
-    paper = load_outline(file_path)
+    if paper is None:
+        paper = load_outline(file_path)
     
     # 输出目录
     default_output = Path("output") / file_path.stem
@@ -642,12 +893,13 @@ def export_flow(file_path: Path, images_dir: Optional[str] = None):
                 style=STYLE,
             ).ask()
             if images_dir:
-                images_dir = images_dir.strip().strip('"').strip("'")
+                images_dir = _PATH_QUOTES_RE.sub("", images_dir)
     else:
         console.print(f"[dim]图片目录: {images_dir}[/dim]")
     
     try:
-        config = load_config()
+        if config is None:
+            config = load_config()
         
         # 生成摘要（如果没有）
         if not has_abstract(paper):
@@ -665,16 +917,14 @@ def export_flow(file_path: Path, images_dir: Optional[str] = None):
         console.print("[cyan]📄 正在生成 LaTeX...[/cyan]")
         
         # 生成 LaTeX
-        renderer = LatexRenderer()
-        latex_content = renderer.render(paper)
+        latex_content = _get_latex_renderer().render(paper)
         latex_file = output_path / f"{paper.title}.tex"
         latex_file.write_text(latex_content, encoding="utf-8")
         
         console.print("[cyan]📝 正在生成 Word...[/cyan]")
         
         # 生成 Word
-        images_path = Path(images_dir) if images_dir else None
-        exporter = WordExporter(images_base_path=images_path)
+        exporter = _get_word_exporter(images_dir or None)
         word_file = output_path / f"{paper.title}.docx"
         exporter.export(paper, word_file)
         
@@ -682,34 +932,32 @@ def export_flow(file_path: Path, images_dir: Optional[str] = None):
         console.print(f"\n[red]错误: {e}[/red]")
         return
     
-    console.print(f"\n[green]✓ 导出完成！[/green]")
-    console.print(f"  LaTeX: {latex_file}")
-    console.print(f"  Word:  {word_file}")
+    console.print(
+        "\n[green]✓ 导出完成！[/green]\n"
+        f"  LaTeX: {latex_file}\n"
+        f"  Word:  {word_file}"
+    )
     
     # 打开输出目录
     if questionary.confirm("是否打开输出目录？", default=True, style=STYLE).ask():
-        import subprocess
-        subprocess.run(["explorer", str(output_path)], shell=True)
+        _open_path(output_path)
 
 
-def full_pipeline_flow(file_path: Path, images_dir: Optional[str] = None):
-    """一键全流程"""
+def full_pipeline_flow(
+    file_path: Path,
+    images_dir: Optional[str] = None,
+    *,
+    paper: Paper | None = None,
+    config: AppConfig | None = None,
+):
+    """一键全流程（可传入调用方已加载的 paper / config，避免重复解析）"""
     console.print("\n[bold cyan]━━━ ⚡ 一键全流程 ━━━[/bold cyan]\n")
     
-    paper = load_outline(file_path)
-    
-    # 检查是否有待生成的图片
-    all_figures = []
-    for section in paper.get_all_sections():
-        all_figures.extend(section.figures)
-    generate_figs = [f for f in all_figures if getattr(f, 'fig_type', None) == FigureType.GENERATE]
+    if paper is None:
+        paper = load_outline(file_path)
     
-    # 根据实际内容状态判断需要哪些步骤
-    # 注意：内容存储在主章节（level==1），子节不存储内容
-    all_sections = paper.get_all_sections()
-    main_chapters = [s for s in all_sections if s.level == 1]
-    need_draft = any(not s.draft_latex for s in main_chapters)
-    need_refine = any(s.draft_latex and not s.final_latex for s in main_chapters)
+    # 检查是否有待生成的图片，并根据实际内容状态判断需要哪些步骤
+    generate_figs, need_draft, need_refine, _ = _paper_progress(paper)
     
     steps = []
     if generate_figs:
@@ -726,112 +974,142 @@ def full_pipeline_flow(file_path: Path, images_dir: Optional[str] = None):
     if not questionary.confirm("确认开始？", default=True, style=STYLE).ask():
         return
     
-    # 输出目录
-    default_output = Path("output") / file_path.stem
-    output_dir = questionary.text(
-        "输出目录：",
-        default=str(default_output),
-        style=STYLE,
-    ).ask()
-    output_path = Path(output_dir)
-    output_path.mkdir(parents=True, exist_ok=True)
-    
-    config = load_config()
+    if config is None:
+        config = load_config()
     step_num = 1
     total_steps = len(steps)
+    output_path: Path | None = None
     
-    try:
-        # 0. 生成图片（如果有）
-        if generate_figs:
-            console.print(f"\n[bold blue]━━━ [{step_num}/{total_steps}] 生成图片 ━━━[/bold blue]\n")
-            step_num += 1
-            
-            # 确定图片输出目录
-            fig_output_dir = output_path / "generated_figures"
-            fig_output_dir.mkdir(parents=True, exist_ok=True)
+    async def pipeline(paper: Paper) -> Paper:
+        """在同一个事件循环中依次执行图片、草稿、润色、摘要各步骤"""
+        nonlocal step_num, output_path
+        renderer = None
+        warmup = None
+        try:
+            # 用户输入输出目录期间，在后台先把浏览器启动起来
+            if generate_figs:
+                from .diagram import MermaidRenderer
+                
+                renderer = MermaidRenderer()
+                warmup = asyncio.create_task(renderer._ensure_browser())
             
-            from .diagram import MermaidRenderer
+            # 输出目录
+            default_output = Path("output") / file_path.stem
+            output_dir = await questionary.text(
+                "输出目录：",
+                default=str(default_output),
+                style=STYLE,
+            ).ask_async()
+            output_path = Path(output_dir)
+            output_path.mkdir(parents=True, exist_ok=True)
             
-            async def generate_all_figures():
-                renderer = MermaidRenderer()
-                generated = 0
-                try:
-                    for i, fig in enumerate(generate_figs, 1):
-                        mermaid_code = getattr(fig, 'mermaid_code', None)
-                        if mermaid_code:
-                            console.print(f"🔧 [{i}/{len(generate_figs)}] {fig.caption}...", end="")
-                            output_file = fig_output_dir / f"{fig.id or f'fig{i}'}.png"
+            # 0. 生成图片（如果有）
+            if generate_figs:
+                console.print(f"\n[bold blue]━━━ [{step_num}/{total_steps}] 生成图片 ━━━[/bold blue]\n")
+                step_num += 1
+                
+                # 确定图片输出目录
+                fig_output_dir = output_path / "generated_figures"
+                fig_output_dir.mkdir(parents=True, exist_ok=True)
+                
+                # 启动失败时不在这里报错，由下面逐张渲染时重新启动并报告
+                await asyncio.gather(warmup, return_exceptions=True)
+                # 各图互不依赖，在同一个浏览器里并发渲染（限制同时打开的页面数）
+                render_jobs = [
+                    (i, fig, fig.mermaid_code)
+                    for i, fig in enumerate(generate_figs, 1)
+                    if fig.mermaid_code
+                ]
+                semaphore = asyncio.Semaphore(_MAX_CONCURRENT_RENDERS)
+                
+                with Progress(
+                    SpinnerColumn(),
+                    TextColumn("[progress.description]{task.description}"),
+                    BarColumn(),
+                    TextColumn("{task.completed}/{task.total}"),
+                    console=console,
+                    transient=True,
+                ) as progress:
+                    task = progress.add_task("正在渲染图片...", total=len(render_jobs))
+                    
+                    async def render_one(i, fig, mermaid_code):
+                        output_file = fig_output_dir / f"{fig.id or f'fig{i}'}.png"
+                        async with semaphore:
                             try:
-                                result = await renderer.render_async(mermaid_code, output_file)
-                                if result and result.exists():
-                                    console.print(f" [green]✓[/green]")
-                                    fig.path = str(result.relative_to(output_path) if output_path.exists() else result)
-                                    fig.fig_type = FigureType.MATCHED
-                                    generated += 1
-                                else:
-                                    console.print(f" [red]✗[/red]")
-                            except Exception as e:
-                                console.print(f" [red]✗ {e}[/red]")
-                finally:
-                    await renderer._close_browser()
-                return generated
-            
-            generated = asyncio.run(generate_all_figures())
-            console.print(f"[green]✓ 已生成 {generated} 个图片[/green]")
-            save_outline(paper, file_path)
-        
-        # 1. 生成草稿
-        if need_draft:
-            console.print(f"\n[bold blue]━━━ [{step_num}/{total_steps}] 生成草稿 ━━━[/bold blue]\n")
-            step_num += 1
-            writing_provider = create_writing_provider(config)
-            step = SectionDraftStep(writing_provider)
+                                return await renderer.render_async(mermaid_code, output_file)
+                            finally:
+                                progress.advance(task)
+                    
+                    results = await asyncio.gather(
+                        *(render_one(*job) for job in render_jobs),
+                        return_exceptions=True,
+                    )
+                
+                # 结果汇总成一段文本一次输出
+                generated = 0
+                lines = []
+                for (i, fig, _), result in zip(render_jobs, results):
+                    # render_async 失败时抛出异常，否则返回已写入的图片路径
+                    if isinstance(result, Exception):
+                        mark = f"[red]✗ {result}[/red]"
+                    else:
+                        mark = "[green]✓[/green]"
+                        fig.path = str(result.relative_to(output_path))
+                        fig.fig_type = FigureType.MATCHED
+                        generated += 1
+                    lines.append(f"🔧 [{i}/{len(generate_figs)}] {fig.caption}... {mark}")
+                lines.append(f"[green]✓ 已生成 {generated} 个图片[/green]")
+                console.print("\n".join(lines))
+                save_outline(paper, file_path)
             
-            async def run_draft():
+            # 1. 生成草稿
+            if need_draft:
+                console.print(f"\n[bold blue]━━━ [{step_num}/{total_steps}] 生成草稿 ━━━[/bold blue]\n")
+                step_num += 1
+                step = SectionDraftStep(writing_provider)
                 context = PipelineContext(paper=paper, llm_options=LLMOptions())
-                return await step.execute(context)
-            
-            result = asyncio.run(run_draft())
-            paper = result.paper
-            save_outline(paper, file_path)
-        
-        # 2. 润色（如果生成了草稿，或者有待润色的内容）
-        if need_draft or need_refine:
-            console.print(f"\n[bold blue]━━━ [{step_num}/{total_steps}] 润色内容 ━━━[/bold blue]\n")
-            step_num += 1
-            writing_provider = create_writing_provider(config)
-            step = SectionRefineStep(writing_provider)
+                paper = (await step.execute(context)).paper
+                save_outline(paper, file_path)
             
-            async def run_refine():
+            # 2. 润色（如果生成了草稿，或者有待润色的内容）
+            if need_draft or need_refine:
+                console.print(f"\n[bold blue]━━━ [{step_num}/{total_steps}] 润色内容 ━━━[/bold blue]\n")
+                step_num += 1
+                step = SectionRefineStep(writing_provider)
                 context = PipelineContext(paper=paper, llm_options=LLMOptions())
-                return await step.execute(context)
+                paper = (await step.execute(context)).paper
+                save_outline(paper, file_path)
             
-            result = asyncio.run(run_refine())
-            paper = result.paper
-            save_outline(paper, file_path)
-        
-        # 3. 生成摘要
-        if not has_abstract(paper):
-            console.print(f"\n[bold blue]━━━ [{step_num}/{total_steps}] 生成摘要 ━━━[/bold blue]\n")
-            step_num += 1
-            thinking_provider = create_thinking_provider(config)
-            step = AbstractGenerateStep(thinking_provider)
-            
-            async def run_abstract():
+            # 3. 生成摘要
+            if not has_abstract(paper):
+                console.print(f"\n[bold blue]━━━ [{step_num}/{total_steps}] 生成摘要 ━━━[/bold blue]\n")
+                step_num += 1
+                thinking_provider = create_thinking_provider(config)
+                step = AbstractGenerateStep(thinking_provider)
                 context = PipelineContext(paper=paper, llm_options=LLMOptions())
-                return await step.execute(context)
-            
-            result = asyncio.run(run_abstract())
-            paper = result.paper
-            save_outline(paper, file_path)
+                paper = (await step.execute(context)).paper
+                save_outline(paper, file_path)
+        finally:
+            if warmup is not None and not warmup.done():
+                warmup.cancel()
+                await asyncio.gather(warmup, return_exceptions=True)
+            # 浏览器在整个流程结束时才关闭
+            if renderer is not None:
+                await renderer._close_browser()
+        
+        return paper
+    
+    try:
+        # 写作模型在草稿和润色两步之间共用，只创建一次
+        writing_provider = create_writing_provider(config) if need_draft or need_refine else None
+        paper = asyncio.run(pipeline(paper))
         
         # 4. 导出
         console.print(f"\n[bold blue]━━━ [{step_num}/{total_steps}] 导出文档 ━━━[/bold blue]\n")
         
         # LaTeX
         console.print("[cyan]📄 正在生成 LaTeX...[/cyan]")
-        renderer = LatexRenderer()
-        latex_content = renderer.render(paper)
+        latex_content = _get_latex_renderer().render(paper)
         latex_file = output_path / f"{paper.title}.tex"
         latex_file.write_text(latex_content, encoding="utf-8")
         
@@ -839,7 +1117,7 @@ def full_pipeline_flow(file_path: Path, images_dir: Optional[str] = None):
         console.print("[cyan]📝 正在生成 Word...[/cyan]")
         # 优先使用生成的图片目录
         images_path = output_path if (output_path / "generated_figures").exists() else (Path(images_dir) if images_dir else None)
-        exporter = WordExporter(images_base_path=images_path)
+        exporter = _get_word_exporter(str(images_path) if images_path else None)
         word_file = output_path / f"{paper.title}.docx"
         exporter.export(paper, word_file)
         
@@ -849,19 +1127,37 @@ def full_pipeline_flow(file_path: Path, images_dir: Optional[str] = None):
         traceback.print_exc()
         return
     
-    console.print(f"\n[bold green]✅ 全部完成！[/bold green]")
-    console.print(f"  LaTeX: {latex_file}")
-    console.print(f"  Word:  {word_file}")
+    console.print(
+        "\n[bold green]✅ 全部完成！[/bold green]\n"
+        f"  LaTeX: {latex_file}\n"
+        f"  Word:  {word_file}"
+    )
     
     # 打开输出目录
     if questionary.confirm("是否打开输出目录？", default=True, style=STYLE).ask():
-        import subprocess
-        subprocess.run(["explorer", str(output_path)], shell=True)
+        _open_path(output_path)
+
+
+def _clear_section_content(paper: Paper, *, keep_draft: bool = False):
+    """清除所有层级章节的正文（keep_draft=True 时保留草稿，只清除润色内容）"""
+    for section in paper.get_all_sections():
+        if not keep_draft:
+            section.draft_latex = None
+        section.final_latex = None
 
 
-def manage_project(file_path: Path):
+def _has_section_content(paper: Paper, *, keep_draft: bool = False) -> bool:
+    """是否有可清除的章节正文（keep_draft=True 时只看润色内容）"""
+    return any(
+        section.final_latex or (not keep_draft and section.draft_latex)
+        for section in paper.get_all_sections()
+    )
+
+
+def manage_project(file_path: Path, *, paper: Paper | None = None):
     """管理单个项目"""
-    paper = load_outline(file_path)
+    if paper is None:
+        paper = load_outline(file_path)
     
     console.print(f"\n[bold cyan]━━━ 🗑️ 项目管理: {paper.title} ━━━[/bold cyan]\n")
     
@@ -889,56 +1185,51 @@ def manage_project(file_path: Path):
         return
     
     if action == "reset_draft":
-        if questionary.confirm("确定要清除所有草稿内容？", default=False, style=STYLE).ask():
-            for section in paper.sections:
-                section.draft_latex = None
-                section.final_latex = None
-                for child in section.children:
-                    child.draft_latex = None
-                    child.final_latex = None
+        if not _has_section_content(paper):
+            console.print("[yellow]没有可清除的草稿内容[/yellow]")
+        elif questionary.confirm("确定要清除所有草稿内容？", default=False, style=STYLE).ask():
+            _clear_section_content(paper)
             paper.status = PaperStatus.OUTLINE_CONFIRMED
             save_outline(paper, file_path)
+            _forget_project_summary(file_path)
             console.print("[green]✓ 已重置所有草稿[/green]")
     
     elif action == "reset_refine":
-        if questionary.confirm("确定要清除润色内容？", default=False, style=STYLE).ask():
-            for section in paper.sections:
-                section.final_latex = None
-                for child in section.children:
-                    child.final_latex = None
+        if not _has_section_content(paper, keep_draft=True):
+            console.print("[yellow]没有可清除的润色内容[/yellow]")
+        elif questionary.confirm("确定要清除润色内容？", default=False, style=STYLE).ask():
+            _clear_section_content(paper, keep_draft=True)
             paper.status = PaperStatus.DRAFT
             save_outline(paper, file_path)
+            _forget_project_summary(file_path)
             console.print("[green]✓ 已重置润色内容[/green]")
     
     elif action == "reset_all":
-        if questionary.confirm("确定要清除所有内容？", default=False, style=STYLE).ask():
-            for section in paper.sections:
-                section.draft_latex = None
-                section.final_latex = None
-                for child in section.children:
-                    child.draft_latex = None
-                    child.final_latex = None
+        if not (_has_section_content(paper) or paper.abstract_cn or paper.abstract_en):
+            console.print("[yellow]已经是大纲状态，没有可清除的内容[/yellow]")
+        elif questionary.confirm("确定要清除所有内容？", default=False, style=STYLE).ask():
+            _clear_section_content(paper)
             paper.status = PaperStatus.OUTLINE_CONFIRMED
             paper.abstract_cn = None
             paper.abstract_en = None
             save_outline(paper, file_path)
+            _forget_project_summary(file_path)
             console.print("[green]✓ 已重置为大纲状态[/green]")
     
     elif action == "delete":
         output_dir = Path("output") / file_path.stem
         if questionary.confirm(f"确定要删除项目 {paper.title}？", default=False, style=STYLE).ask():
             file_path.unlink()
+            _forget_project_summary(file_path)
             console.print(f"[green]✓ 已删除配置文件[/green]")
             if output_dir.exists():
-                import shutil
                 shutil.rmtree(output_dir)
                 console.print(f"[green]✓ 已删除输出目录[/green]")
     
     elif action == "open_output":
         output_dir = Path("output") / file_path.stem
         if output_dir.exists():
-            import subprocess
-            subprocess.run(["explorer", str(output_dir)], shell=True)
+            _open_path(output_dir)
         else:
             console.print("[yellow]输出目录不存在[/yellow]")
 
@@ -948,36 +1239,24 @@ def manage_projects_flow():
     console.print("\n[bold cyan]━━━ 🗂️ 项目管理 ━━━[/bold cyan]\n")
     
     # 扫描已有的 YAML 文件
-    yaml_files = list(Path(".").glob("*.yaml")) + list(Path("examples").glob("*.yaml"))
-    yaml_files = [f for f in yaml_files if not f.name.startswith("_template")]
+    yaml_files = _find_project_files(skip_templates=True)
     
     if not yaml_files:
         console.print("[yellow]未找到任何项目文件[/yellow]")
         return
     
-    # 构建选项
-    choices = []
-    for f in yaml_files[:20]:
-        try:
-            paper = load_outline(f)
-            # 统计章节状态
-            total = len(paper.sections)
-            drafted = sum(1 for s in paper.sections if s.draft_latex)
-            refined = sum(1 for s in paper.sections if s.final_latex)
-            choices.append(questionary.Choice(
-                f"📄 {paper.title[:30]} ({drafted}/{total}草稿, {refined}/{total}润色)",
-                value=str(f),
-            ))
-        except Exception:
-            choices.append(questionary.Choice(f"❓ {f.name}", value=str(f)))
-    
-    choices.append(questionary.Choice("↩️  返回", value="back"))
+    def format_choice(f: Path, summary: _ProjectSummary | None) -> questionary.Choice:
+        if summary is None:
+            return questionary.Choice(f"❓ {f.name}", value=str(f))
+        total = summary.total
+        return questionary.Choice(
+            f"📄 {summary.title[:30]} ({summary.drafted}/{total}草稿, {summary.refined}/{total}润色)",
+            value=str(f),
+        )
     
-    selected = questionary.select(
-        "选择要管理的项目：",
-        choices=choices,
-        style=STYLE,
-    ).ask()
+    selected = _select_project("选择要管理的项目：", yaml_files, format_choice, [
+        questionary.Choice("↩️  返回", value="back"),
+    ])
     
     if selected == "back":
         return
@@ -1018,39 +1297,35 @@ def manage_projects_flow():
         return
     
     if action == "reset_draft":
-        if questionary.confirm("确定要清除所有草稿内容？此操作不可撤销！", default=False, style=STYLE).ask():
-            for section in paper.sections:
-                section.draft_latex = None
-                section.final_latex = None
-                for child in section.children:
-                    child.draft_latex = None
-                    child.final_latex = None
+        if not _has_section_content(paper):
+            console.print("[yellow]没有可清除的草稿内容[/yellow]")
+        elif questionary.confirm("确定要清除所有草稿内容？此操作不可撤销！", default=False, style=STYLE).ask():
+            _clear_section_content(paper)
             paper.status = PaperStatus.OUTLINE_CONFIRMED
             save_outline(paper, file_path)
+            _forget_project_summary(file_path)
             console.print("[green]✓ 已重置所有草稿[/green]")
     
     elif action == "reset_refine":
-        if questionary.confirm("确定要清除润色内容？草稿将保留。", default=False, style=STYLE).ask():
-            for section in paper.sections:
-                section.final_latex = None
-                for child in section.children:
-                    child.final_latex = None
+        if not _has_section_content(paper, keep_draft=True):
+            console.print("[yellow]没有可清除的润色内容[/yellow]")
+        elif questionary.confirm("确定要清除润色内容？草稿将保留。", default=False, style=STYLE).ask():
+            _clear_section_content(paper, keep_draft=True)
             paper.status = PaperStatus.DRAFT
             save_outline(paper, file_path)
+            _forget_project_summary(file_path)
             console.print("[green]✓ 已重置润色内容，草稿已保留[/green]")
     
     elif action == "reset_all":
-        if questionary.confirm("确定要清除所有内容？只保留大纲结构。", default=False, style=STYLE).ask():
-            for section in paper.sections:
-                section.draft_latex = None
-                section.final_latex = None
-                for child in section.children:
-                    child.draft_latex = None
-                    child.final_latex = None
+        if not (_has_section_content(paper) or paper.abstract_cn or paper.abstract_en):
+            console.print("[yellow]已经是大纲状态，没有可清除的内容[/yellow]")
+        elif questionary.confirm("确定要清除所有内容？只保留大纲结构。", default=False, style=STYLE).ask():
+            _clear_section_content(paper)
             paper.status = PaperStatus.OUTLINE_CONFIRMED
             paper.abstract_cn = None
             paper.abstract_en = None
             save_outline(paper, file_path)
+            _forget_project_summary(file_path)
             console.print("[green]✓ 已重置为大纲状态[/green]")
     
     elif action == "delete":
@@ -1062,19 +1337,18 @@ def manage_projects_flow():
         
         if questionary.confirm("确定要删除？此操作不可撤销！", default=False, style=STYLE).ask():
             file_path.unlink()
+            _forget_project_summary(file_path)
             console.print(f"[green]✓ 已删除配置文件[/green]")
             
             if output_dir.exists():
                 if questionary.confirm("是否同时删除输出目录？", default=False, style=STYLE).ask():
-                    import shutil
                     shutil.rmtree(output_dir)
                     console.print(f"[green]✓ 已删除输出目录[/green]")
     
     elif action == "open_output":
         output_dir = Path("output") / file_path.stem
         if output_dir.exists():
-            import subprocess
-            subprocess.run(["explorer", str(output_dir)], shell=True)
+            _open_path(output_dir)
         else:
             console.print("[yellow]输出目录不存在[/yellow]")
 
@@ -1083,15 +1357,15 @@ def process_figure_suggestions(paper: Paper, yaml_path: Path, images_dir: str |
     """处理 AI 建议的图片"""
     console.print("\n[bold cyan]━━━ 🔧 处理图片建议 ━━━[/bold cyan]\n")
     
+    # rich.syntax 会加载 pygments，只在这里用到，不放到模块顶部
+    from rich.syntax import Syntax
     from .diagram import MermaidRenderer
-    from .models import FigureType
     
     # 收集所有需要处理的图片
     figures_to_process = []
     for section in paper.get_all_sections():
         for fig in section.figures:
-            fig_type = getattr(fig, 'fig_type', FigureType.MATCHED)
-            if fig_type in [FigureType.GENERATE, FigureType.MISSING]:
+            if fig.fig_type in [FigureType.GENERATE, FigureType.MISSING]:
                 figures_to_process.append((section, fig))
     
     if not figures_to_process:
@@ -1104,6 +1378,8 @@ def process_figure_suggestions(paper: Paper, yaml_path: Path, images_dir: str |
     else:
         output_dir = Path("output") / yaml_path.stem / "generated_figures"
     output_dir.mkdir(parents=True, exist_ok=True)
+    # 图片路径记录为相对图片目录上一级的路径（目录刚创建，一定存在）
+    figures_base = output_dir.parent
     
     console.print(f"共有 [cyan]{len(figures_to_process)}[/cyan] 个图片待处理")
     console.print(f"[dim]图片将保存到: {output_dir}[/dim]\n")
@@ -1122,12 +1398,6 @@ def process_figure_suggestions(paper: Paper, yaml_path: Path, images_dir: str |
     if mode == "cancel":
         return
     
-    # 图标定义
-    type_icons = {
-        FigureType.GENERATE: ("🔧", "blue", "可自动生成"),
-        FigureType.MISSING: ("⚠", "yellow", "用户标注需要"),
-    }
-    
     generated_count = 0
     skipped_count = 0
     
@@ -1137,156 +1407,152 @@ def process_figure_suggestions(paper: Paper, yaml_path: Path, images_dir: str |
         
         renderer = MermaidRenderer()
         
+        async def render_batch(jobs: list[tuple[int, Figure]]):
+            """并发渲染一批图片（限制同时打开的页面数），结果按原顺序汇总输出"""
+            nonlocal generated_count, skipped_count
+            total = len(figures_to_process)
+            render_jobs = [(i, fig) for i, fig in jobs if fig.mermaid_code]
+            semaphore = asyncio.Semaphore(_MAX_CONCURRENT_RENDERS)
+            
+            with Progress(
+                SpinnerColumn(),
+                TextColumn("[progress.description]{task.description}"),
+                BarColumn(),
+                TextColumn("{task.completed}/{task.total}"),
+                console=console,
+                transient=True,
+            ) as progress:
+                task = progress.add_task("正在渲染图片...", total=len(render_jobs))
+                
+                async def render_one(i, fig):
+                    output_file = output_dir / f"{fig.id or f'fig{i}'}.png"
+                    async with semaphore:
+                        try:
+                            return await renderer.render_async(fig.mermaid_code, output_file)
+                        finally:
+                            progress.advance(task)
+                
+                results = await asyncio.gather(
+                    *(render_one(*job) for job in render_jobs),
+                    return_exceptions=True,
+                )
+            results_by_index = {i: result for (i, _), result in zip(render_jobs, results)}
+            
+            lines = []
+            for i, fig in jobs:
+                if i not in results_by_index:
+                    lines.append(f"[dim]⏭️  [{i}/{total}] {fig.caption} (无法自动生成)[/dim]")
+                    skipped_count += 1
+                    continue
+                icon, color, _ = _TYPE_ICONS.get(fig.fig_type, ("?", "white", "未知"))
+                result = results_by_index[i]
+                # render_async 失败时抛出异常，否则返回已写入的图片路径
+                if isinstance(result, Exception):
+                    mark = f"[red]✗ {result}[/red]"
+                    skipped_count += 1
+                else:
+                    mark = "[green]✓[/green]"
+                    generated_count += 1
+                    fig.path = str(result.relative_to(figures_base))
+                    fig.fig_type = FigureType.MATCHED
+                lines.append(f"[{color}]{icon}[/{color}] [{i}/{total}] {fig.caption}... {mark}")
+            console.print("\n".join(lines))
+        
         try:
+            if mode == "auto":
+                # 自动模式：各图互不依赖，在同一个浏览器里并发渲染
+                await render_batch([(i, fig) for i, (_, fig) in enumerate(figures_to_process, 1)])
+                return
+            
+            # 手动模式：逐个确认
             for i, (section, fig) in enumerate(figures_to_process, 1):
-                fig_type = getattr(fig, 'fig_type', FigureType.GENERATE)
-                icon, color, type_label = type_icons.get(fig_type, ("?", "white", "未知"))
-                mermaid_code = getattr(fig, 'mermaid_code', None)
-                can_generate = getattr(fig, 'can_generate', False) or mermaid_code
+                fig_type = fig.fig_type
+                icon, color, type_label = _TYPE_ICONS.get(fig_type, ("?", "white", "未知"))
+                mermaid_code = fig.mermaid_code
+                can_generate = fig.can_generate or mermaid_code
                 
-                if mode == "auto":
-                    # 自动模式：直接生成
-                    if can_generate and mermaid_code:
-                        console.print(f"[{color}]{icon}[/{color}] [{i}/{len(figures_to_process)}] {fig.caption}...", end="")
-                        output_file = output_dir / f"{fig.id or f'fig{i}'}.png"
-                        
-                        try:
-                            result = await renderer.render_async(mermaid_code, output_file)
-                            if result and result.exists():
-                                console.print(f" [green]✓[/green]")
-                                generated_count += 1
-                                fig.path = str(result.relative_to(output_dir.parent) if output_dir.parent.exists() else result)
-                                fig.fig_type = FigureType.MATCHED
-                            else:
-                                console.print(f" [red]✗[/red]")
-                                skipped_count += 1
-                        except Exception as e:
-                            console.print(f" [red]✗ {e}[/red]")
-                            skipped_count += 1
-                    else:
-                        console.print(f"[dim]⏭️  [{i}/{len(figures_to_process)}] {fig.caption} (无法自动生成)[/dim]")
-                        skipped_count += 1
+                console.print(f"\n[{color}]{icon}[/{color}] [{i}/{len(figures_to_process)}] {fig.caption}")
+                console.print(f"   章节: [dim]{section.title}[/dim]")
+                if fig.suggestion:
+                    console.print(f"   建议: [dim]{fig.suggestion}[/dim]")
                 
+                # 如果有 Mermaid 代码，显示预览
+                if mermaid_code:
+                    console.print(Panel(
+                        Syntax(mermaid_code, "text", theme="monokai", line_numbers=False),
+                        title="Mermaid 代码预览",
+                        width=60,
+                    ))
+                
+                # 询问操作
+                if can_generate and mermaid_code:
+                    choices = [
+                        questionary.Choice("✓ 生成图片", value="generate"),
+                        questionary.Choice("📝 编辑代码后生成", value="edit"),
+                        questionary.Choice("⏭️  跳过", value="skip"),
+                        questionary.Choice("🚀 生成剩余全部", value="auto_rest"),
+                        questionary.Choice("🚫 跳过后续所有", value="skip_all"),
+                    ]
                 else:
-                    # 手动模式：逐个确认
-                    console.print(f"\n[{color}]{icon}[/{color}] [{i}/{len(figures_to_process)}] {fig.caption}")
-                    console.print(f"   章节: [dim]{section.title}[/dim]")
-                    if fig.suggestion:
-                        console.print(f"   建议: [dim]{fig.suggestion}[/dim]")
-                    
-                    # 如果有 Mermaid 代码，显示预览
-                    if mermaid_code:
-                        from rich.syntax import Syntax
-                        from rich.panel import Panel
-                        console.print(Panel(
-                            Syntax(mermaid_code, "text", theme="monokai", line_numbers=False),
-                            title="Mermaid 代码预览",
-                            width=60,
-                        ))
-                    
-                    # 询问操作
-                    if can_generate and mermaid_code:
-                        choices = [
-                            questionary.Choice("✓ 生成图片", value="generate"),
-                            questionary.Choice("📝 编辑代码后生成", value="edit"),
-                            questionary.Choice("⏭️  跳过", value="skip"),
-                            questionary.Choice("🚀 生成剩余全部", value="auto_rest"),
-                            questionary.Choice("🚫 跳过后续所有", value="skip_all"),
-                        ]
-                    else:
-                        choices = [
-                            questionary.Choice("⏭️  跳过（需手动补充）", value="skip"),
-                            questionary.Choice("🚫 跳过后续所有", value="skip_all"),
-                        ]
-                    
-                    action = questionary.select(
-                        "操作：",
-                        choices=choices,
+                    choices = [
+                        questionary.Choice("⏭️  跳过（需手动补充）", value="skip"),
+                        questionary.Choice("🚫 跳过后续所有", value="skip_all"),
+                    ]
+                
+                action = questionary.select(
+                    "操作：",
+                    choices=choices,
+                    style=STYLE,
+                ).ask()
+                
+                if action == "skip_all":
+                    console.print(f"[dim]跳过剩余 {len(figures_to_process) - i} 个图片[/dim]")
+                    break
+                
+                if action == "auto_rest":
+                    # 切换到自动模式，与一键生成相同地并发处理剩余图片（包括当前这个）
+                    console.print("[cyan]切换到自动模式...[/cyan]")
+                    await render_batch([(j, f) for j, (_, f) in enumerate(figures_to_process[i - 1:], i)])
+                    break
+                
+                if action == "skip":
+                    skipped_count += 1
+                    continue
+                
+                current_code = mermaid_code
+                if action == "edit":
+                    # 多行编辑器一次读入整段代码，并以当前代码为初始内容，粘贴长代码也不会逐行读取
+                    edited = await questionary.text(
+                        "编辑 Mermaid 代码：",
+                        default=mermaid_code,
+                        multiline=True,
+                        instruction="（Esc 后回车 或 Alt+Enter 结束）",
                         style=STYLE,
-                    ).ask()
-                    
-                    if action == "skip_all":
-                        console.print(f"[dim]跳过剩余 {len(figures_to_process) - i} 个图片[/dim]")
-                        break
-                    
-                    if action == "auto_rest":
-                        # 切换到自动模式处理剩余图片（包括当前这个）
-                        console.print("[cyan]切换到自动模式...[/cyan]")
-                        # 先处理当前这个
-                        if mermaid_code:
-                            output_file = output_dir / f"{fig.id or f'fig{i}'}.png"
-                            try:
-                                result = await renderer.render_async(mermaid_code, output_file)
-                                if result and result.exists():
-                                    console.print(f"   [green]✓ 已生成: {result.name}[/green]")
-                                    generated_count += 1
-                                    fig.path = str(result.relative_to(output_dir.parent) if output_dir.parent.exists() else result)
-                                    fig.fig_type = FigureType.MATCHED
-                            except Exception as e:
-                                console.print(f"   [red]✗ 错误: {e}[/red]")
-                                skipped_count += 1
-                        
-                        # 处理剩余的
-                        for j, (sec2, fig2) in enumerate(figures_to_process[i:], i + 1):
-                            mermaid_code2 = getattr(fig2, 'mermaid_code', None)
-                            can_gen2 = getattr(fig2, 'can_generate', False) or mermaid_code2
-                            
-                            if can_gen2 and mermaid_code2:
-                                console.print(f"🔧 [{j}/{len(figures_to_process)}] {fig2.caption}...", end="")
-                                output_file2 = output_dir / f"{fig2.id or f'fig{j}'}.png"
-                                try:
-                                    result2 = await renderer.render_async(mermaid_code2, output_file2)
-                                    if result2 and result2.exists():
-                                        console.print(f" [green]✓[/green]")
-                                        generated_count += 1
-                                        fig2.path = str(result2.relative_to(output_dir.parent) if output_dir.parent.exists() else result2)
-                                        fig2.fig_type = FigureType.MATCHED
-                                    else:
-                                        console.print(f" [red]✗[/red]")
-                                        skipped_count += 1
-                                except Exception as e:
-                                    console.print(f" [red]✗ {e}[/red]")
-                                    skipped_count += 1
-                            else:
-                                console.print(f"[dim]⏭️  [{j}/{len(figures_to_process)}] {fig2.caption} (无法自动生成)[/dim]")
-                                skipped_count += 1
-                        break
-                    
-                    if action == "skip":
+                    ).ask_async()
+                    current_code = (edited or "").strip()
+                    if not current_code:
+                        # 取消编辑或清空代码时与「跳过」一样计入跳过数
+                        console.print("   [dim]⏭️  代码为空，已跳过[/dim]")
                         skipped_count += 1
                         continue
+
+                if action in ["generate", "edit"] and current_code:
+                    output_file = output_dir / f"{fig.id or f'fig{i}'}.png"
                     
-                    current_code = mermaid_code
-                    if action == "edit":
-                        console.print("[dim]请输入新的 Mermaid 代码（输入空行后按回车结束）:[/dim]")
-                        lines = []
-                        while True:
-                            line = input()
-                            if line.strip() == "" and lines:
-                                break
-                            lines.append(line)
-                        current_code = "\n".join(lines)
-                    
-                    if action in ["generate", "edit"] and current_code:
-                        output_file = output_dir / f"{fig.id or f'fig{i}'}.png"
-                        
-                        try:
-                            console.print(f"   [dim]正在渲染...[/dim]", end="")
-                            result = await renderer.render_async(current_code, output_file)
-                            if result and result.exists():
-                                console.print(f"\r   [green]✓ 已生成: {result.name}[/green]")
-                                generated_count += 1
-                                fig.path = str(result.relative_to(output_dir.parent) if output_dir.parent.exists() else result)
-                                fig.fig_type = FigureType.MATCHED
-                                if action == "edit":
-                                    fig.mermaid_code = current_code
-                            else:
-                                console.print(f"\r   [red]✗ 生成失败[/red]")
-                                skipped_count += 1
-                        except Exception as e:
-                            console.print(f"\r   [red]✗ 错误: {e}[/red]")
-                            skipped_count += 1
-        
+                    console.print(f"   [dim]正在渲染...[/dim]", end="")
+                    try:
+                        result = await renderer.render_async(current_code, output_file)
+                    except Exception as e:
+                        console.print(f"\r   [red]✗ 错误: {e}[/red]")
+                        skipped_count += 1
+                    else:
+                        console.print(f"\r   [green]✓ 已生成: {result.name}[/green]")
+                        generated_count += 1
+                        fig.path = str(result.relative_to(figures_base))
+                        fig.fig_type = FigureType.MATCHED
+                        if action == "edit":
+                            fig.mermaid_code = current_code
+    
         finally:
             # 确保关闭浏览器
             await renderer._close_browser()
@@ -1344,44 +1610,45 @@ def generate_diagrams_for_paper(paper: Paper, yaml_path: Path, images_dir: str |
     console.print(f"\n[dim]图表将保存到: {output_dir}[/dim]\n")
     
     from .diagram import MermaidRenderer
-    renderer = MermaidRenderer()
     
     generated_files = []
     
-    for diagram_type in diagram_choices:
-        console.print(f"[cyan]正在生成 {diagram_type} 图表...[/cyan]")
-        
-        # 根据论文信息生成图表代码
-        mermaid_code = _generate_diagram_code_for_paper(paper, diagram_type)
-        
-        if mermaid_code:
-            output_file = output_dir / f"{diagram_type}_{paper.title[:10]}.png"
-            try:
-                result = asyncio.run(renderer.render_async(mermaid_code, output_file))
-                if result and result.exists():
-                    console.print(f"[green]  ✓ 已生成: {result.name}[/green]")
-                    generated_files.append(result)
-                else:
-                    console.print(f"[yellow]  ⚠ 生成失败[/yellow]")
-            except Exception as e:
-                console.print(f"[red]  ✗ 错误: {e}[/red]")
+    async def render_all():
+        """在同一个事件循环和浏览器中依次渲染所选图表"""
+        renderer = MermaidRenderer()
+        try:
+            for diagram_type in diagram_choices:
+                console.print(f"[cyan]正在生成 {diagram_type} 图表...[/cyan]")
+                
+                # 根据论文信息生成图表代码
+                mermaid_code = _generate_diagram_code_for_paper(paper, diagram_type)
+                
+                if mermaid_code:
+                    output_file = output_dir / f"{diagram_type}_{paper.title[:10]}.png"
+                    try:
+                        result = await renderer.render_async(mermaid_code, output_file)
+                    except Exception as e:
+                        console.print(f"[red]  ✗ 错误: {e}[/red]")
+                    else:
+                        console.print(f"[green]  ✓ 已生成: {result.name}[/green]")
+                        generated_files.append(result)
+        finally:
+            await renderer._close_browser()
+    
+    asyncio.run(render_all())
     
     if generated_files:
         console.print(f"\n[green]✓ 共生成 {len(generated_files)} 个图表[/green]")
         
         # 询问是否打开输出目录
         if questionary.confirm("是否打开图表目录？", default=True, style=STYLE).ask():
-            import subprocess
-            subprocess.run(["explorer", str(output_dir)], shell=True)
+            _open_path(output_dir)
 
 
-def _generate_diagram_code_for_paper(paper: Paper, diagram_type: str) -> str:
-    """根据论文信息生成 Mermaid 图表代码"""
-    title = paper.title
-    
-    if diagram_type == "flowchart":
-        # 系统架构流程图
-        return f"""flowchart TB
+# 根据论文生成图表时使用的 Mermaid 代码模板，只有 {title} 占位符会被替换
+_DIAGRAM_TEMPLATES: dict[str, str] = {
+    # 系统架构流程图
+    "flowchart": """flowchart TB
     subgraph 表示层
         A[用户界面]
     end
@@ -1402,11 +1669,10 @@ def _generate_diagram_code_for_paper(paper: Paper, diagram_type: str) -> str:
     B --> D
     C --> E
     D --> E
-    E --> F"""
+    E --> F""",
     
-    elif diagram_type == "er":
-        # ER 图
-        return """erDiagram
+    # ER 图
+    "er": """erDiagram
     USER ||--o{ ORDER : places
     USER {
         int id PK
@@ -1437,11 +1703,10 @@ def _generate_diagram_code_for_paper(paper: Paper, diagram_type: str) -> str:
         string description
         decimal price
         int stock
-    }"""
+    }""",
     
-    elif diagram_type == "sequence":
-        # 时序图
-        return """sequenceDiagram
+    # 时序图
+    "sequence": """sequenceDiagram
     participant U as 用户
     participant C as 客户端
     participant S as 服务器
@@ -1452,11 +1717,10 @@ def _generate_diagram_code_for_paper(paper: Paper, diagram_type: str) -> str:
     S->>D: 查询数据
     D-->>S: 返回结果
     S-->>C: 响应数据
-    C-->>U: 显示结果"""
+    C-->>U: 显示结果""",
     
-    elif diagram_type == "class":
-        # 类图
-        return """classDiagram
+    # 类图
+    "class": """classDiagram
     class User {
         +int id
         +String username
@@ -1484,11 +1748,10 @@ def _generate_diagram_code_for_paper(paper: Paper, diagram_type: str) -> str:
     
     User <|-- Admin
     User --> Service
-    Service --> Database"""
+    Service --> Database""",
     
-    elif diagram_type == "mindmap":
-        # 思维导图
-        return f"""mindmap
+    # 思维导图
+    "mindmap": """mindmap
     root(({title}))
         用户管理
             登录注册
@@ -1501,9 +1764,15 @@ def _generate_diagram_code_for_paper(paper: Paper, diagram_type: str) -> str:
         系统管理
             系统配置
             日志管理
-            备份恢复"""
-    
-    return ""
+            备份恢复""",
+}
+
+
+def _generate_diagram_code_for_paper(paper: Paper, diagram_type: str) -> str:
+    """根据论文信息生成 Mermaid 图表代码"""
+    template = _DIAGRAM_TEMPLATES.get(diagram_type, "")
+    # ER 图、类图等模板本身含有花括号，只对带标题占位符的模板做格式化
+    return template.format(title=paper.title) if "{title}" in template else template
 
 
 def diagram_flow():
@@ -1532,16 +1801,12 @@ def diagram_flow():
     console.print("\n[dim]参考模板：[/dim]")
     console.print(f"[cyan]{template}[/cyan]\n")
     
-    console.print("[dim]请输入 Mermaid 代码（按 Ctrl+D 或 Ctrl+Z 结束）：[/dim]")
-    lines = []
-    try:
-        while True:
-            line = input()
-            lines.append(line)
-    except EOFError:
-        pass
-    
-    mermaid_code = "\n".join(lines)
+    mermaid_code = questionary.text(
+        "请输入 Mermaid 代码：",
+        multiline=True,
+        instruction="（Esc 后回车 或 Alt+Enter 结束）",
+        style=STYLE,
+    ).ask() or ""
     
     if not mermaid_code.strip():
         console.print("[yellow]未输入代码[/yellow]")
@@ -1577,8 +1842,7 @@ def diagram_flow():
     
     # 打开图片
     if questionary.confirm("是否打开查看？", default=True, style=STYLE).ask():
-        import subprocess
-        subprocess.run(["explorer", output_file], shell=True)
+        _open_path(output_file)
 
 
 def settings_flow():
@@ -1637,18 +1901,8 @@ def help_flow():
     questionary.press_any_key_to_continue("按任意键返回...").ask()
 
 
-def display_outline_preview(paper: Paper):
-    """显示大纲预览，包含图片状态"""
-    from .models import FigureType
-    
-    # 图片状态图标
-    fig_icons = {
-        FigureType.MATCHED: ("✓", "green", "已匹配"),
-        FigureType.GENERATE: ("🔧", "blue", "可生成"),
-        FigureType.SUGGESTED: ("💡", "yellow", "建议补充"),
-        FigureType.MISSING: ("⚠", "red", "待补充"),
-    }
-    
+def display_outline_preview(paper: Paper, all_sections: List[Section] | None = None):
+    """显示大纲预览，包含图片状态（可传入已展开的全部章节，避免重复遍历）"""
     table = Table(title="大纲预览", show_header=True, width=70)
     table.add_column("章节", style="cyan")
     table.add_column("字数", justify="right", width=6)
@@ -1660,36 +1914,38 @@ def display_outline_preview(paper: Paper):
         if not figures:
             return "[dim]-[/dim]"
         
-        status_parts = []
-        for fig in figures[:3]:  # 最多显示3个
-            fig_type = getattr(fig, 'fig_type', FigureType.MATCHED)
-            icon, color, _ = fig_icons.get(fig_type, ("?", "white", "未知"))
-            status_parts.append(f"[{color}]{icon}[/{color}]")
-        
-        result = " ".join(status_parts)
+        # 最多显示3个
+        result = " ".join(
+            _FIG_MARKUP.get(fig.fig_type, "[white]?[/white]")
+            for fig in figures[:3]
+        )
         if len(figures) > 3:
             result += f" +{len(figures)-3}"
         return result
     
-    def add_row(section, indent=0):
+    # 用显式栈按先序展开章节树，每节最多显示 5 个子节；
+    # 栈中的整数项表示被省略的子节数，在对应子节之后输出一行提示
+    rows: list[tuple[str, str, str, str]] = []
+    stack: list[tuple[Section | int, int]] = [(s, 0) for s in reversed(paper.sections[:8])]  # 最多显示 8 章
+    while stack:
+        section, indent = stack.pop()
         prefix = "  " * indent
-        status = "✓" if section.draft_latex else "-"
-        words = str(section.target_words or "") if section.target_words else ""
-        figs_str = format_figures(section.figures)
-        
-        table.add_row(
+        if isinstance(section, int):
+            rows.append((f"{prefix}... 还有 {section} 个", "", "", "[dim]-[/dim]"))
+            continue
+        rows.append((
             f"{prefix}{section.title[:35]}",
-            f"[dim]{words}[/dim]",
-            figs_str,
-            f"[green]{status}[/green]" if section.draft_latex else f"[dim]{status}[/dim]",
-        )
-        for child in section.children[:5]:  # 最多显示 5 个子节
-            add_row(child, indent + 1)
-        if len(section.children) > 5:
-            table.add_row(f"{prefix}  ... 还有 {len(section.children) - 5} 个", "", "", "[dim]-[/dim]")
+            f"[dim]{section.target_words or ''}[/dim]",
+            format_figures(section.figures),
+            "[green]✓[/green]" if section.draft_latex else "[dim]-[/dim]",
+        ))
+        children = section.children
+        if len(children) > 5:
+            stack.append((len(children) - 5, indent + 1))
+        stack.extend((child, indent + 1) for child in reversed(children[:5]))
     
-    for section in paper.sections[:8]:  # 最多显示 8 章
-        add_row(section)
+    for row in rows:
+        table.add_row(*row)
     
     if len(paper.sections) > 8:
         table.add_row(f"... 还有 {len(paper.sections) - 8} 章", "", "", "-")
@@ -1697,20 +1953,19 @@ def display_outline_preview(paper: Paper):
     console.print(table)
     
     # 显示图片统计
-    all_figures = []
-    for section in paper.get_all_sections():
-        all_figures.extend(section.figures)
+    if all_sections is None:
+        all_sections = paper.get_all_sections()
+    all_figures = [fig for section in all_sections for fig in section.figures]
     
     if all_figures:
         stats = {ft: 0 for ft in FigureType}
         for fig in all_figures:
-            fig_type = getattr(fig, 'fig_type', FigureType.MATCHED)
-            stats[fig_type] = stats.get(fig_type, 0) + 1
+            stats[fig.fig_type] = stats.get(fig.fig_type, 0) + 1
         
         stat_parts = []
         for ft, count in stats.items():
             if count > 0:
-                icon, color, label = fig_icons.get(ft, ("?", "white", "未知"))
+                icon, color, label = _FIG_ICONS.get(ft, ("?", "white", "未知"))
                 stat_parts.append(f"[{color}]{icon} {label}: {count}[/{color}]")
         
         if stat_parts:
@@ -1739,15 +1994,14 @@ def show_detailed_status(paper: Paper):
     console.print(f"  已生成草稿: {drafted}")
     console.print(f"  已润色: {refined}")
     
-    display_outline_preview(paper)
+    display_outline_preview(paper, all_sections=all_sections)
     
     questionary.press_any_key_to_continue("按任意键返回...").ask()
 
 
-def get_template(template_type: str) -> str:
-    """获取大纲模板"""
-    templates = {
-        "management": """第1章 绪论
+# 新建项目时可选的大纲模板
+_OUTLINE_TEMPLATES: dict[str, str] = {
+    "management": """第1章 绪论
 1.1 研究背景与意义
 1.2 国内外研究现状
 1.3 研究内容与方法
@@ -1785,8 +2039,8 @@ def get_template(template_type: str) -> str:
 第7章 总结与展望
 7.1 工作总结
 7.2 未来展望""",
-        
-        "ai": """第1章 绪论
+    
+    "ai": """第1章 绪论
 1.1 研究背景与意义
 1.2 国内外研究现状
 1.3 研究内容与创新点
@@ -1815,8 +2069,8 @@ def get_template(template_type: str) -> str:
 5.1 工作总结
 5.2 研究局限
 5.3 未来工作""",
-        
-        "general": """第1章 绪论
+    
+    "general": """第1章 绪论
 1.1 研究背景
 1.2 研究意义
 1.3 研究现状
@@ -1842,21 +2096,24 @@ def get_template(template_type: str) -> str:
 5.1 研究结论
 5.2 研究不足
 5.3 未来展望""",
-    }
-    return templates.get(template_type, templates["general"])
+}
 
 
-def get_diagram_template(diagram_type: str) -> str:
-    """获取图表模板"""
-    templates = {
-        "flowchart": """flowchart TD
+def get_template(template_type: str) -> str:
+    """获取大纲模板"""
+    return _OUTLINE_TEMPLATES.get(template_type, _OUTLINE_TEMPLATES["general"])
+
+
+# 「生成图表」菜单中各图表类型的示例 Mermaid 代码
+_DIAGRAM_EXAMPLES: dict[str, str] = {
+    "flowchart": """flowchart TD
     A[开始] --> B{条件判断}
     B -->|是| C[执行操作]
     B -->|否| D[其他操作]
     C --> E[结束]
     D --> E""",
-        
-        "sequence": """sequenceDiagram
+    
+    "sequence": """sequenceDiagram
     participant 用户
     participant 系统
     participant 数据库
@@ -1864,8 +2121,8 @@ def get_diagram_template(diagram_type: str) -> str:
     系统->>数据库: 查询数据
     数据库-->>系统: 返回结果
     系统-->>用户: 显示结果""",
-        
-        "er": """erDiagram
+    
+    "er": """erDiagram
     USER ||--o{ ORDER : places
     ORDER ||--|{ ORDER_ITEM : contains
     PRODUCT ||--o{ ORDER_ITEM : included_in
@@ -1874,8 +2131,8 @@ def get_diagram_template(diagram_type: str) -> str:
         string name
         string email
     }""",
-        
-        "class": """classDiagram
+    
+    "class": """classDiagram
     class User {
         +int id
         +String name
@@ -1888,8 +2145,8 @@ def get_diagram_template(diagram_type: str) -> str:
         +submit()
     }
     User "1" --> "*" Order : creates""",
-        
-        "mindmap": """mindmap
+    
+    "mindmap": """mindmap
   root((系统功能))
     用户管理
       用户注册
@@ -1899,14 +2156,18 @@ def get_diagram_template(diagram_type: str) -> str:
       数据查询
       数据编辑
       报表导出""",
-        
-        "pie": """pie title 模块分布
+    
+    "pie": """pie title 模块分布
     "用户模块" : 25
     "订单模块" : 30
     "商品模块" : 25
     "其他" : 20""",
-    }
-    return templates.get(diagram_type, "")
+}
+
+
+def get_diagram_template(diagram_type: str) -> str:
+    """获取图表模板"""
+    return _DIAGRAM_EXAMPLES.get(diagram_type, "")
 
 
 def run_tui():
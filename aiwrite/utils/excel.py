@@ -6,8 +6,42 @@ Excel 表格解析工具
 
 from __future__ import annotations
 
+import datetime
+import functools
+import os
+import zipfile
+from contextlib import closing
+from itertools import islice, zip_longest
 from pathlib import Path
 from typing import Any
+from xml.etree import ElementTree
+
+try:
+    # Rust 实现的表格解析库，比 openpyxl 快数倍且内存占用小（可选依赖）
+    from python_calamine import CalamineWorkbook
+except ImportError:
+    CalamineWorkbook = None
+
+try:
+    import xlrd
+except ImportError:
+    xlrd = None
+
+_SPREADSHEET_NS = "{http://schemas.openxmlformats.org/spreadsheetml/2006/main}"
+
+# LaTeX 特殊字符转义表（一次 translate 完成，替换结果不会被再次转义）
+_LATEX_ESCAPE_TABLE = str.maketrans({
+    "\\": "\\textbackslash{}",
+    "&": "\\&",
+    "%": "\\%",
+    "$": "\\$",
+    "#": "\\#",
+    "_": "\\_",
+    "{": "\\{",
+    "}": "\\}",
+    "~": "\\textasciitilde{}",
+    "^": "\\textasciicircum{}",
+})
 
 
 def read_excel_file(file_path: str | Path) -> list[list[str]]:
@@ -20,68 +54,120 @@ def read_excel_file(file_path: str | Path) -> list[list[str]]:
     Returns:
         二维列表，每个内层列表代表一行
     """
-    file_path = Path(file_path)
+    # 统一成字符串路径，用 os.path 判断，不构造 Path 对象
+    file_path = os.fspath(file_path)
     
-    if not file_path.exists():
+    if not os.path.exists(file_path):
         raise FileNotFoundError(f"Excel 文件不存在: {file_path}")
     
-    suffix = file_path.suffix.lower()
+    suffix = os.path.splitext(file_path)[1].lower()
+    
+    if suffix not in (".xlsx", ".xls"):
+        raise ValueError(f"不支持的文件格式: {suffix}")
+    
+    # 安装了 python-calamine 时两种格式都用它读取：
+    # .xlsx 读活动工作表（与 openpyxl 的 wb.active 一致），.xls 与 xlrd 一样读第一个工作表
+    if CalamineWorkbook is not None:
+        sheet_index = _xlsx_active_sheet_index(file_path) if suffix == ".xlsx" else 0
+        if sheet_index is not None:
+            return _read_with_calamine(file_path, sheet_index)
     
     if suffix == ".xlsx":
         return _read_xlsx(file_path)
-    elif suffix == ".xls":
-        return _read_xls(file_path)
-    else:
-        raise ValueError(f"不支持的文件格式: {suffix}")
+    return _read_xls(file_path)
 
 
-def _read_xlsx(file_path: Path) -> list[list[str]]:
+def _read_xlsx(file_path: str) -> list[list[str]]:
     """读取 .xlsx 文件"""
     from openpyxl import load_workbook
     
-    wb = load_workbook(file_path, read_only=True, data_only=True)
-    ws = wb.active
+    rows: list[list[str]] = []
+    # 不解析外部链接；values_only 直接产出单元格值，不创建 Cell 对象
+    # 只读模式下工作簿一直占着 zip 文件句柄，出错时也要关闭
+    with closing(load_workbook(file_path, read_only=True, data_only=True, keep_links=False)) as wb:
+        for row in wb.active.iter_rows(values_only=True):
+            # 跳过完全空白的行
+            if _has_content(row):
+                rows.append(["" if value is None else str(value) for value in row])
+    
+    return rows
+
+
+def _xlsx_active_sheet_index(file_path: str) -> int | None:
+    """
+    读取 .xlsx 的活动工作表序号
+
+    与 openpyxl 相同：取 xl/workbook.xml 中第一个带 activeTab 的 workbookView，都没有则为 0；
+    文件结构不标准而无法确定时返回 None，由 openpyxl 读取
+    """
+    try:
+        with zipfile.ZipFile(file_path) as archive:
+            root = ElementTree.fromstring(archive.read("xl/workbook.xml"))
+    except (OSError, KeyError, zipfile.BadZipFile, ElementTree.ParseError):
+        return None
+    for view in root.iter(f"{_SPREADSHEET_NS}workbookView"):
+        active_tab = view.get("activeTab")
+        if active_tab is not None:
+            return int(active_tab) if active_tab.isdigit() else None
+    return 0
+
+
+def _read_with_calamine(file_path: str, sheet_index: int = 0) -> list[list[str]]:
+    """用 python-calamine 读取指定序号的工作表（支持 .xlsx 和 .xls）"""
+    with CalamineWorkbook.from_path(file_path) as wb:
+        if sheet_index >= len(wb.sheet_names):
+            # 活动工作表序号超出范围，交给 openpyxl 按原有逻辑处理
+            return _read_xlsx(file_path)
+        # 保留开头的空行空列，与 openpyxl 读出的行列位置一致
+        data = wb.get_sheet_by_index(sheet_index).to_python(skip_empty_area=False)
     
     rows: list[list[str]] = []
-    for row in ws.iter_rows():
-        row_data = []
-        for cell in row:
-            value = cell.value
-            if value is None:
-                row_data.append("")
-            else:
-                row_data.append(str(value))
+    for row in data:
         # 跳过完全空白的行
-        if any(cell.strip() for cell in row_data):
-            rows.append(row_data)
-    
-    wb.close()
+        if _has_content(row):
+            rows.append([_calamine_cell_to_str(value) for value in row])
     return rows
 
 
-def _read_xls(file_path: Path) -> list[list[str]]:
+def _calamine_cell_to_str(value: Any) -> str:
+    """把 calamine 读出的单元格值转成与 openpyxl 读取结果相同的字符串"""
+    if isinstance(value, str):
+        return value
+    if isinstance(value, float) and value.is_integer() and abs(value) < 1e15:
+        # calamine 把所有数字读成 float，openpyxl 对整数单元格返回 int
+        return str(int(value))
+    if isinstance(value, datetime.date) and not isinstance(value, datetime.datetime):
+        # 零点的日期 calamine 返回 date，openpyxl 返回 datetime
+        return str(datetime.datetime(value.year, value.month, value.day))
+    return str(value)
+
+
+def _read_xls(file_path: str) -> list[list[str]]:
     """读取 .xls 文件"""
-    import xlrd
-    
-    wb = xlrd.open_workbook(file_path)
-    ws = wb.sheet_by_index(0)
+    if xlrd is None:
+        raise ImportError("需要安装 xlrd: pip install xlrd")
     
     rows: list[list[str]] = []
-    for row_idx in range(ws.nrows):
-        row_data = []
-        for col_idx in range(ws.ncols):
-            value = ws.cell_value(row_idx, col_idx)
-            if value is None:
-                row_data.append("")
-            else:
-                row_data.append(str(value))
-        # 跳过完全空白的行
-        if any(cell.strip() for cell in row_data):
-            rows.append(row_data)
+    # 读完即释放工作簿占用的内存
+    with xlrd.open_workbook(file_path) as wb:
+        ws = wb.sheet_by_index(0)
+        for row_idx in range(ws.nrows):
+            values = ws.row_values(row_idx)
+            # 跳过完全空白的行
+            if _has_content(values):
+                rows.append(["" if value is None else str(value) for value in values])
     
     return rows
 
 
+def _has_content(values) -> bool:
+    """一行原始单元格值中是否有非空白内容（数字、日期等非字符串值一定算有内容）"""
+    return any(
+        value is not None and (not isinstance(value, str) or value.strip())
+        for value in values
+    )
+
+
 def table_to_markdown(rows: list[list[str]]) -> str:
     """
     将表格数据转换为 Markdown 格式
@@ -97,35 +183,40 @@ def table_to_markdown(rows: list[list[str]]) -> str:
     
     # 第一行是表头
     header = rows[0]
+    num_cols = len(header)
     
-    # 计算每列的最大宽度
-    col_widths = [len(h) for h in header]
-    for row in rows[1:]:
-        for i, cell in enumerate(row):
-            if i < len(col_widths):
-                col_widths[i] = max(col_widths[i], len(cell))
-    
-    # 构建 Markdown 表格
-    lines = []
+    # 转置后一次算出每列的最大宽度（超出表头的列不输出）
+    col_widths = tuple(
+        max(map(len, column))
+        for column in islice(zip_longest(*rows, fillvalue=""), num_cols)
+    )
     
-    # 表头
-    header_line = "| " + " | ".join(h.ljust(w) for h, w in zip(header, col_widths)) + " |"
-    lines.append(header_line)
+    # 所有行共用同一个格式模板
+    row_fmt, separator = _markdown_row_format(col_widths)
     
-    # 分隔线
-    separator = "| " + " | ".join("-" * w for w in col_widths) + " |"
-    lines.append(separator)
+    # 预分配：表头 + 分隔线 + 每个数据行各占一项
+    lines: list[str] = [""] * (len(rows) + 1)
+    lines[0] = row_fmt.format(*header)
+    lines[1] = separator
     
     # 数据行
-    for row in rows[1:]:
-        # 确保行长度与表头一致
-        padded_row = row + [""] * (len(header) - len(row))
-        row_line = "| " + " | ".join(c.ljust(w) for c, w in zip(padded_row, col_widths)) + " |"
-        lines.append(row_line)
+    for i, row in enumerate(rows[1:], 2):
+        # 确保行长度与表头一致（多出的单元格被模板忽略）
+        if len(row) < num_cols:
+            row = row + [""] * (num_cols - len(row))
+        lines[i] = row_fmt.format(*row)
     
     return "\n".join(lines)
 
 
+@functools.lru_cache(maxsize=64)
+def _markdown_row_format(col_widths: tuple[int, ...]) -> tuple[str, str]:
+    """按列宽生成 Markdown 行格式模板和分隔线（同一结构的多张表共用缓存结果）"""
+    row_fmt = "| " + " | ".join(f"{{:<{w}}}" for w in col_widths) + " |"
+    separator = "| " + " | ".join("-" * w for w in col_widths) + " |"
+    return row_fmt, separator
+
+
 def table_to_latex(rows: list[list[str]]) -> str:
     """
     将表格数据转换为 LaTeX 格式
@@ -149,18 +240,21 @@ def table_to_latex(rows: list[list[str]]) -> str:
         "\\hline",
     ]
     
+    # 局部绑定，避免循环中反复查找全局名
+    esc = _escape_latex
+    
     # 表头（加粗）
     header = rows[0]
-    header_line = " & ".join(f"\\textbf{{{_escape_latex(h)}}}" for h in header) + " \\\\"
-    lines.append(header_line)
+    lines.append(" & ".join([f"\\textbf{{{esc(h)}}}" for h in header]) + " \\\\")
     lines.append("\\hline")
     
     # 数据行
     for row in rows[1:]:
-        # 确保行长度与表头一致
-        padded_row = row + [""] * (num_cols - len(row))
-        row_line = " & ".join(_escape_latex(c) for c in padded_row) + " \\\\"
-        lines.append(row_line)
+        cells = [esc(c) for c in row]
+        # 确保行长度与表头一致（直接补在转义结果上，不复制原行）
+        if len(cells) < num_cols:
+            cells += [""] * (num_cols - len(cells))
+        lines.append(" & ".join(cells) + " \\\\")
     
     lines.extend([
         "\\hline",
@@ -171,20 +265,7 @@ def table_to_latex(rows: list[list[str]]) -> str:
     return "\n".join(lines)
 
 
+@functools.lru_cache(maxsize=4096)
 def _escape_latex(text: str) -> str:
-    """转义 LaTeX 特殊字符"""
-    replacements = [
-        ("\\", "\\textbackslash{}"),
-        ("&", "\\&"),
-        ("%", "\\%"),
-        ("$", "\\$"),
-        ("#", "\\#"),
-        ("_", "\\_"),
-        ("{", "\\{"),
-        ("}", "\\}"),
-        ("~", "\\textasciitilde{}"),
-        ("^", "\\textasciicircum{}"),
-    ]
-    for old, new in replacements:
-        text = text.replace(old, new)
-    return text
+    """转义 LaTeX 特殊字符（表格中大量重复的短单元格直接命中缓存）"""
+    return text.translate(_LATEX_ESCAPE_TABLE)
@@ -0,0 +1,41 @@
+"""
+测试 Excel 表格读取（非交互式，不调用 LLM）
+
+.xlsx 应读取工作簿的活动工作表：无论是否安装了 python-calamine，结果都要与 openpyxl 的 wb.active 一致。
+"""
+import tempfile
+from pathlib import Path
+
+from openpyxl import Workbook
+
+from aiwrite.utils import excel
+from aiwrite.utils.excel import read_excel_file
+
+
+def test_xlsx_reads_active_sheet():
+    wb = Workbook()
+    cover = wb.active
+    cover.title = "Cover"
+    cover.append(["cover"])
+    data = wb.create_sheet("Data")
+    data.append(["h1", "h2"])
+    data.append([1, 2])
+    # 活动工作表不是第一个
+    wb.active = 1
+
+    expected = [["h1", "h2"], ["1", "2"]]
+    with tempfile.TemporaryDirectory() as tmp:
+        path = Path(tmp) / "active.xlsx"
+        wb.save(path)
+
+        assert excel._read_xlsx(str(path)) == expected
+        assert read_excel_file(path) == expected
+        if excel.CalamineWorkbook is not None:
+            assert excel._xlsx_active_sheet_index(str(path)) == 1
+            assert excel._read_with_calamine(str(path), 1) == expected
+
+    print("✅ .xlsx 读取的是活动工作表")
+
+
+if __name__ == "__main__":
+    test_xlsx_reads_active_sheet()
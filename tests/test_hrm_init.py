@@ -72,7 +72,7 @@ async def test_full_init():
     
     # 1. 扫描图片
     print("\n【步骤1】扫描并识别图片...")
-    images = await initializer.scan_images()
+    images = await initializer.scan_images(concurrency=16)
     print(f"\n✅ 识别到 {len(images)} 张图片:")
     for img in images:
         print(f"   - {img['filename']}: {img['description'][:40]}...")
@@ -101,26 +101,28 @@ async def test_full_init():
     print(f"\n📚 章节数: {len(sections)}")
     
     # 统计匹配的图片
-    def show_section(s, indent=0):
-        prefix = "  " * indent
-        figures = s.get("figures", [])
-        tables = s.get("tables", [])
-        fig_info = f" [图×{len(figures)}]" if figures else ""
-        tab_info = f" [表×{len(tables)}]" if tables else ""
-        print(f"{prefix}{s.get('title', '未命名')}{fig_info}{tab_info}")
-        
-        # 显示匹配的图片
-        for f in figures:
-            print(f"{prefix}  📷 {f.get('caption', '')} → {f.get('path', '')}")
-        for t in tables:
-            print(f"{prefix}  📊 {t.get('caption', '')} → {t.get('path', '')}")
-        
-        for child in s.get("children", []):
-            show_section(child, indent + 1)
+    def show_sections(sections):
+        # 显式栈做先序遍历，子章节逆序入栈以保持原有显示顺序
+        stack = [(s, 0) for s in reversed(sections)]
+        while stack:
+            s, indent = stack.pop()
+            prefix = "  " * indent
+            figures = s.get("figures", [])
+            tables = s.get("tables", [])
+            fig_info = f" [图×{len(figures)}]" if figures else ""
+            tab_info = f" [表×{len(tables)}]" if tables else ""
+            print(f"{prefix}{s.get('title', '未命名')}{fig_info}{tab_info}")
+            
+            # 显示匹配的图片
+            for f in figures:
+                print(f"{prefix}  📷 {f.get('caption', '')} → {f.get('path', '')}")
+            for t in tables:
+                print(f"{prefix}  📊 {t.get('caption', '')} → {t.get('path', '')}")
+            
+            stack.extend((child, indent + 1) for child in reversed(s.get("children", [])))
     
     print("\n📖 章节结构与图表匹配:")
-    for s in sections:
-        show_section(s)
+    show_sections(sections)
     
     # 显示缺失的图表
     missing = result.get("missing_diagrams", [])
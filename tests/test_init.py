@@ -57,7 +57,7 @@ async def test_init():
     print("\n" + "="*50)
     print("步骤 1: 扫描并识别图片")
     print("="*50)
-    images = await initializer.scan_images()
+    images = await initializer.scan_images(concurrency=16)
     print(f"\n识别到 {len(images)} 张图片:")
     for img in images:
         print(f"  - {img['filename']}: {img['description']}")
@@ -88,10 +88,13 @@ async def test_init():
     
     # 统计匹配的图片
     def count_figures(sections):
+        # 显式栈遍历整棵章节树
         count = 0
-        for s in sections:
+        stack = list(sections)
+        while stack:
+            s = stack.pop()
             count += len(s.get('figures', []))
-            count += count_figures(s.get('children', []))
+            stack.extend(s.get('children', []))
         return count
     
     matched = count_figures(result.get('sections', []))
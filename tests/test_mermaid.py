@@ -88,15 +88,18 @@ async def test_mermaid():
     print("测试 Mermaid 图表生成")
     print("=" * 50)
     
-    for case in test_cases:
-        print(f"\n生成 {case['name']}...")
-        output_path = Path(case["output"])
-        
-        try:
-            await renderer.render_async(case["code"], output_path)
-            print(f"  ✅ 成功: {output_path}")
-        except Exception as e:
-            print(f"  ❌ 失败: {e}")
+    # 各图表互不依赖，共用同一个浏览器并发渲染
+    results = await asyncio.gather(
+        *(renderer.render_async(case["code"], Path(case["output"])) for case in test_cases),
+        return_exceptions=True,
+    )
+    
+    for case, result in zip(test_cases, results):
+        print(f"\n{case['name']}")
+        if isinstance(result, Exception):
+            print(f"  ❌ 失败: {result}")
+        else:
+            print(f"  ✅ 成功: {result}")
     
     print("\n" + "=" * 50)
     print(f"图表已保存到 {output_dir}")
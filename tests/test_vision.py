@@ -15,7 +15,7 @@ async def test_vision():
     
     # 测试识别 img2 目录下的所有图片
     img_dir = Path("examples/img2")
-    images = list(img_dir.glob("*.png"))
+    images = sorted(img_dir.glob("*.png"))
     
     prompt = """请简洁描述这张图片的内容，用于论文写作。
 
@@ -25,18 +25,30 @@ async def test_vision():
 3. 如果是系统图/流程图/时序图等，指出是什么类型的图
 """
     
-    print(f"\n发现 {len(images)} 张图片")
+    print(f"\n发现 {len(images)} 张图片，并发识别中...")
     
-    for image_path in sorted(images):
-        print(f"\n正在识别: {image_path.name}")
-        try:
-            response = await provider.invoke_vision(
+    # 各图片的识别请求互不依赖，并发发出；用信号量限制同时请求数，避免触发限流
+    semaphore = asyncio.Semaphore(8)
+    
+    async def describe(image_path):
+        async with semaphore:
+            return await provider.invoke_vision(
                 prompt=prompt,
                 image_paths=[image_path],
             )
-            print(f"  → {response.content}")
-        except Exception as e:
-            print(f"  → 错误: {e}")
+    
+    results = await asyncio.gather(
+        *(describe(image_path) for image_path in images),
+        return_exceptions=True,
+    )
+    
+    # 按文件名顺序输出结果
+    for image_path, result in zip(images, results):
+        print(f"\n{image_path.name}")
+        if isinstance(result, Exception):
+            print(f"  → 错误: {result}")
+        else:
+            print(f"  → {result.content}")
 
 if __name__ == "__main__":
     asyncio.run(test_vision())
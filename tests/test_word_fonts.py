@@ -0,0 +1,65 @@
+"""
+测试 Word 导出的标题字体（非交互式，不调用 LLM）
+
+标题段落不再逐个 run 写东亚字体，而是从标题样式继承；
+默认模板的标题样式带主题字体属性，若未清除，中文标题会显示成主题里的宋体。
+"""
+import tempfile
+from pathlib import Path
+
+from docx import Document
+from docx.oxml.ns import qn
+
+from aiwrite.models import Paper, Section
+from aiwrite.render.word import WordExporter
+
+
+def effective_east_asia_font(paragraph, run) -> str | None:
+    """按 run → 段落样式链 的顺序解析 run 实际使用的东亚字体名（主题属性优先于字体名）"""
+    candidates = [run._r.rPr]
+    style = paragraph.style
+    while style is not None:
+        candidates.append(style.element.rPr)
+        style = style.base_style
+    for rPr in candidates:
+        rFonts = rPr.rFonts if rPr is not None else None
+        if rFonts is None:
+            continue
+        if rFonts.get(qn('w:eastAsiaTheme')) is not None:
+            return f"theme:{rFonts.get(qn('w:eastAsiaTheme'))}"
+        if rFonts.get(qn('w:eastAsia')) is not None:
+            return rFonts.get(qn('w:eastAsia'))
+    return None
+
+
+def test_heading_fonts():
+    paper = Paper(
+        title="标题字体测试",
+        sections=[
+            Section(id="ch1", title="绪论", level=1, final_latex="正文内容。", children=[
+                Section(id="ch1.1", title="研究背景", level=2, final_latex="正文内容。", children=[
+                    Section(id="ch1.1.1", title="国内现状", level=3, final_latex="正文内容。"),
+                ]),
+            ]),
+        ],
+    )
+
+    with tempfile.TemporaryDirectory() as tmp:
+        output_path = WordExporter(method="docx").export(paper, Path(tmp) / "fonts.docx")
+        doc = Document(str(output_path))
+
+    headings = [p for p in doc.paragraphs if p.style.name.startswith("Heading") and p.text]
+    heading_texts = [p.text for p in headings]
+    assert {"绪论", "研究背景", "国内现状"} <= set(heading_texts), heading_texts
+
+    for paragraph in headings:
+        for run in paragraph.runs:
+            font = effective_east_asia_font(paragraph, run)
+            print(f"{paragraph.style.name}: {run.text} → {font}")
+            assert font == "黑体", f"{paragraph.text!r} 的东亚字体为 {font}"
+
+    print("✅ 标题东亚字体均为黑体")
+
+
+if __name__ == "__main__":
+    test_heading_fonts()